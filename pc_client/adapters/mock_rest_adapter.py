@@ -9,6 +9,10 @@ import logging
 import time
 from typing import Any, Dict, Optional, Tuple, cast
 
+import httpx
+
+from pc_client.adapters.rest_adapter import QueryParams
+
 logger = logging.getLogger(__name__)
 
 
@@ -185,14 +189,13 @@ class MockRestAdapter:
             },
         ]
 
-    async def fetch_binary(
-        self, path: str, params: Optional[Dict[str, Any]] = None
-    ) -> Tuple[bytes, str, Dict[str, str]]:
+    async def fetch_binary(self, path: str, params: Optional[QueryParams] = None) -> Tuple[bytes, str, httpx.Headers]:
         """
         Return mock binary content (e.g., camera images).
 
         Returns:
-            Tuple of (content bytes, media type, response headers)
+            Tuple of (content bytes, media type, response headers). Headers are
+            case-insensitive ``httpx.Headers``, like the real adapter's.
         """
         # Small 2x2 PNG image (valid PNG format)
         # This is a minimal valid PNG file with a 2x2 pixel image
@@ -203,10 +206,12 @@ class MockRestAdapter:
             b"\x0f\x04\x0c\x0c\x0c\x0c\x00\x01\x04\x01\x00tC^\x8f\x00\x00\x00\x00IEND"
             b"\xaeB`\x82"
         )
-        headers = {
-            "content-type": "image/png",
-            "last-modified": "Thu, 01 Jan 2025 00:00:00 GMT",
-        }
+        headers = httpx.Headers(
+            {
+                "Content-Type": "image/png",
+                "Last-Modified": "Thu, 01 Jan 2025 00:00:00 GMT",
+            }
+        )
         return mock_image, "image/png", headers
 
     async def close(self):
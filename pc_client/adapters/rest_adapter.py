@@ -3,11 +3,15 @@
 import httpx
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 from urllib.parse import quote
 
 logger = logging.getLogger(__name__)
 
+# Query parameters forwarded to httpx: a mapping, or a tuple of (key, value) pairs that keeps
+# repeated keys. Both are covariant, so they stay assignable to httpx's own ``params`` type.
+QueryParams = Union[Mapping[str, str], Tuple[Tuple[str, str], ...]]
+
 
 class RestAdapter:
     """Adapter for consuming REST API from Rider-PI."""
@@ -69,26 +73,25 @@ class RestAdapter:
 
         self.client = httpx.AsyncClient(**client_kwargs)
 
-    async def fetch_binary(
-        self, path: str, params: Optional[Dict[str, Any]] = None
-    ) -> Tuple[bytes, str, Dict[str, str]]:
+    async def fetch_binary(self, path: str, params: Optional[QueryParams] = None) -> Tuple[bytes, str, httpx.Headers]:
         """
         Fetch binary content (images, streams) from Rider-PI endpoints.
 
         Args:
             path: Endpoint path starting with '/'
-            params: Optional query parameters
+            params: Optional query parameters (mapping or tuple of key/value pairs,
+                the latter preserving repeated keys)
 
         Returns:
-            Tuple of (content bytes, media type, response headers)
+            Tuple of (content bytes, media type, response headers). Headers are the
+            case-insensitive ``httpx.Headers`` of the response, not a copy.
         """
         url = f"{self.base_url}{path}"
         try:
             response = await self.client.get(url, params=params)
             response.raise_for_status()
             media_type = response.headers.get("content-type", "application/octet-stream")
-            headers = {key: value for key, value in response.headers.items()}
-            return response.content, media_type, headers
+            return response.content, media_type, response.headers
         except Exception as e:
             logger.error(f"Error fetching binary content from {url}: {e}")
             raise
@@ -0,0 +1,205 @@
+"""Pure helpers backing the control router's local (Rider-PI offline) fallbacks.
+
+The functions here operate on plain dicts/lists only (no FastAPI objects), are fully
+typed and free of I/O, so the module can be compiled ahead-of-time with mypyc
+(``mypyc pc_client/api/control_utils.py``) without touching the router.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+LOCAL_FEATURE_BLUEPRINTS: List[Dict[str, Any]] = [
+    {
+        "name": "s0_manual",
+        "scenario": "S0",
+        "title": "Stan 0 – Sterowanie ręczne",
+        "description": "Podstawowe usługi komunikacji i sterowania ręcznego.",
+        "units": [
+            "rider-cam-preview.service",
+            "rider-edge-preview.service",
+        ],
+        "aliases": ["zero_mode"],
+        "state_key": "zero",
+    },
+    {
+        "name": "s3_follow_me_face",
+        "scenario": "S3",
+        "title": "Śledzenie (twarz)",
+        "description": "Tracker oraz kontroler ruchu związanego z trybem Follow Me.",
+        "units": [
+            "rider-tracker.service",
+            "rider-tracking-controller.service",
+        ],
+        "aliases": ["face_tracking"],
+        "state_key": "tracking",
+    },
+    {
+        "name": "s4_recon",
+        "scenario": "S4",
+        "title": "Rekonesans autonomiczny",
+        "description": "Navigator + odometria i procesy mapowania.",
+        "units": [
+            "rider-vision.service",
+        ],
+        "aliases": ["recon"],
+        "state_key": "recon",
+    },
+]
+
+VALID_TRACKING_MODES = frozenset(("face", "hand", "none"))
+ACTIVE_TRACKING_MODES = frozenset(("face", "hand"))
+# Indexed by (feature_active << 1) | (any_service_active).
+FEATURE_STATUSES = ("inactive", "partial", "active", "active")
+
+# Feature activity per blueprint state_key, indexed by (recon_active << 1) | tracking_enabled.
+_FEATURE_ACTIVE_TABLE: Dict[Any, Tuple[bool, bool, bool, bool]] = {
+    "tracking": (False, True, False, True),
+    "recon": (False, False, True, True),
+    "zero": (True, False, False, False),
+}
+_INACTIVE_ROW = (False, False, False, False)
+
+
+def normalize_tracking_request(payload: Dict[str, Any]) -> Tuple[str, bool]:
+    """Validate and normalize tracking payload similar to Rider-PI.
+
+    Raises:
+        ValueError: When the requested mode is not supported.
+    """
+    raw_mode = str(payload.get("mode", "none")).strip().lower()
+    if raw_mode not in VALID_TRACKING_MODES:
+        raise ValueError(f"Invalid tracking mode '{raw_mode}'")
+    enabled = bool(payload.get("enabled", raw_mode in ACTIVE_TRACKING_MODES))
+    if not enabled:
+        raw_mode = "none"
+    return raw_mode, raw_mode != "none"
+
+
+def normalize_feature_payload(name: str, payload: Dict[str, Any]) -> Tuple[str, bool]:
+    """Normalize feature toggle payload for local fallback."""
+    normalized = str(name or "").strip().lower()
+    enabled = bool(payload.get("enabled"))
+    return normalized, enabled
+
+
+def feature_state_flags(control_state: Dict[str, Any]) -> Tuple[bool, bool]:
+    """Return (tracking_enabled, recon_active) flags from control state."""
+    tracking = control_state.get("tracking", {}) or {}
+    tracking_enabled = bool(tracking.get("enabled"))
+    recon = control_state.get("navigator", {}) or {}
+    recon_active = bool(recon.get("active"))
+    return tracking_enabled, recon_active
+
+
+def is_feature_active(blueprint: Dict[str, Any], tracking_enabled: bool, recon_active: bool) -> bool:
+    """Return True when the blueprint's state key matches the current flags."""
+    table = _FEATURE_ACTIVE_TABLE.get(blueprint.get("state_key"), _INACTIVE_ROW)
+    return table[(recon_active << 1) | tracking_enabled]
+
+
+def services_by_unit(services: List[Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+    """Index systemd service entries by unit name (first entry wins on duplicates)."""
+    return {svc.get("unit"): svc for svc in reversed(services)}
+
+
+def service_entry(unit: str, by_unit: Dict[Any, Dict[str, Any]]) -> Dict[str, Any]:
+    """Normalize a systemd unit entry for feature rows."""
+    data = by_unit.get(unit) or {"unit": unit}
+    active = str(data.get("active", "")).lower()
+    enabled = str(data.get("enabled", "")).lower()
+    return {
+        "unit": unit,
+        "desc": data.get("desc", ""),
+        "active": data.get("active"),
+        "sub": data.get("sub"),
+        "enabled": data.get("enabled"),
+        "is_active": active.startswith("active"),
+        "is_enabled": enabled.startswith("enabled"),
+    }
+
+
+def local_feature_rows(
+    services: List[Dict[str, Any]],
+    control_state: Dict[str, Any],
+    by_unit: Optional[Dict[Any, Dict[str, Any]]] = None,
+) -> List[Dict[str, Any]]:
+    """Build logic feature rows from local service and control state.
+
+    ``by_unit`` is the :func:`services_by_unit` index of ``services``; it is built
+    here when the caller has not already done so.
+    """
+    if by_unit is None:
+        by_unit = services_by_unit(services or [])
+    tracking_enabled, recon_active = feature_state_flags(control_state)
+    rows: List[Dict[str, Any]] = []
+    for blueprint in LOCAL_FEATURE_BLUEPRINTS:
+        units = blueprint.get("units", [])
+        svc_entries = [service_entry(unit, by_unit) for unit in units]
+        row = {
+            "name": blueprint["name"],
+            "scenario": blueprint.get("scenario"),
+            "title": blueprint.get("title"),
+            "description": blueprint.get("description"),
+            "aliases": blueprint.get("aliases", []),
+            "services": svc_entries,
+            "active": is_feature_active(blueprint, tracking_enabled, recon_active),
+        }
+        rows.append(row)
+    return rows
+
+
+def local_logic_summary(services: List[Dict[str, Any]], control_state: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize logic features (active/partial/inactive) from local state."""
+    features = local_feature_rows(services, control_state, services_by_unit(services or []))
+    summary_rows: List[Dict[str, Any]] = []
+    active_names: List[str] = []
+    partial_names: List[str] = []
+    names_by_status = {"active": active_names, "partial": partial_names}
+    for row in features:
+        services = row.get("services", [])
+        total = len(services)
+        active_count = sum(bool(svc.get("is_active")) for svc in services)
+        status = FEATURE_STATUSES[(bool(row.get("active")) << 1) | (active_count > 0)]
+        if status in names_by_status:
+            names_by_status[status].append(row["name"])
+        summary_rows.append(
+            {
+                "name": row["name"],
+                "scenario": row.get("scenario"),
+                "title": row.get("title"),
+                "description": row.get("description"),
+                "active": row.get("active", False),
+                "status": status,
+                "services_total": total,
+                "services_active": active_count,
+                "aliases": row.get("aliases", []),
+            }
+        )
+    payload = {
+        "features": summary_rows,
+        "active": active_names,
+        "partial": partial_names,
+        "counts": {"total": len(summary_rows), "active": len(active_names), "partial": len(partial_names)},
+    }
+    return {"ok": True, "summary": payload}
+
+
+def local_motion_queue_snapshot(entries: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Return motion queue items based on locally captured commands."""
+    now = time.time()
+    items: List[Dict[str, Any]] = []
+    for entry in reversed(entries or []):
+        cmd = entry.get("command", {}) if isinstance(entry, dict) else {}
+        ts = entry.get("ts", 0) if isinstance(entry, dict) else 0
+        items.append(
+            {
+                "source": cmd.get("source") or cmd.get("provider") or "pc-ui",
+                "vx": cmd.get("vx"),
+                "vy": cmd.get("vy"),
+                "yaw": cmd.get("yaw"),
+                "time_s": cmd.get("t"),
+                "status": cmd.get("status") or cmd.get("cmd"),
+                "age_s": round(max(0.0, now - ts), 2) if ts else None,
+            }
+        )
+    return {"items": items}
@@ -6,7 +6,7 @@ import logging
 import time
 from datetime import timezone
 from email.utils import parsedate_to_datetime
-from typing import Any, Dict, Optional, Callable, Awaitable, Tuple
+from typing import Any, Dict, Mapping, Optional, Callable, Awaitable, Tuple
 
 from fastapi import FastAPI
 from pc_client.adapters import RestAdapter
@@ -346,6 +346,7 @@ async def sync_data_periodically(app: FastAPI):
         tracking_remote = data.get("tracking")
         if isinstance(tracking_remote, dict):
             app.state.control_state["tracking"] = tracking_remote
+            app.state.control_state_version = getattr(app.state, "control_state_version", 0) + 1
 
     async def _fetch_and_cache(
         cache_key: str,
@@ -430,7 +431,7 @@ async def sync_data_periodically(app: FastAPI):
         await asyncio.sleep(2)
 
 
-def _last_modified_timestamp(headers: Dict[str, str]) -> Optional[float]:
+def _last_modified_timestamp(headers: Mapping[str, str]) -> Optional[float]:
     """Return UNIX timestamp if Last-Modified header is present."""
     last_modified = next((value for key, value in headers.items() if key.lower() == "last-modified"), None)
     if not last_modified:
@@ -456,6 +457,7 @@ async def _fetch_and_store_camera_frame(app: FastAPI) -> None:
     timestamp = _last_modified_timestamp(headers) or time.time()
     app.state.last_camera_frame = {
         "content": content,
+        "length": len(content),
         "media_type": media_type,
         "timestamp": timestamp,
     }
@@ -478,6 +480,22 @@ async def sync_camera_frame_periodically(app: FastAPI, interval: float = 0.8):
         raise
 
 
+async def sse_heartbeat_periodically(app: FastAPI, interval: float = 5.0):
+    """
+    Background task pushing a shared heartbeat frame to every SSE subscriber.
+
+    Each frame also wakes idle /events streams, so a client that went away is
+    noticed and unsubscribed within one interval.
+    """
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            app.state.sse_manager.publish({"topic": "heartbeat", "data": {"status": "ok"}}, retain=False)
+    except asyncio.CancelledError:
+        logger.info("SSE heartbeat task cancelled")
+        raise
+
+
 async def start_provider_heartbeat(app: FastAPI):
     """Start provider heartbeat loop to register with Rider-PI."""
     settings: Settings = app.state.settings
@@ -655,6 +673,13 @@ async def startup_event(app: FastAPI):
         app.state.sync_task = None
         logger.info("Rider-PI sync tasks skipped (adapter disabled)")
 
+    app.state.sse_manager.start()
+    if app.state.sse_heartbeat_task:
+        app.state.sse_heartbeat_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await app.state.sse_heartbeat_task
+    app.state.sse_heartbeat_task = asyncio.create_task(sse_heartbeat_periodically(app))
+
     # Initialize and start ServiceWatchdog if enabled
     app.state.service_watchdog = None
     if settings.auto_heal_enabled:
@@ -705,6 +730,12 @@ async def shutdown_event(app: FastAPI):
         with contextlib.suppress(asyncio.CancelledError):
             await app.state.camera_sync_task
 
+    if app.state.sse_heartbeat_task:
+        app.state.sse_heartbeat_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await app.state.sse_heartbeat_task
+    await app.state.sse_manager.stop()
+
     # Stop task queue worker / providers
     if app.state.provider_worker:
         await app.state.provider_worker.stop()
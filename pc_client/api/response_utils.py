@@ -0,0 +1,10 @@
+"""HTTP response helpers shared by API routers."""
+
+from typing import Dict
+
+# Cache policy for cheap, frequently polled read-only endpoints (status panels, dashboards).
+# Clients may reuse a response for 2 s and keep showing it while revalidating for up to 10 s more.
+# "private" because some payloads (e.g. the Google Home profile) are user specific.
+POLL_CACHE_CONTROL = "private, max-age=2, stale-while-revalidate=10"
+
+POLL_CACHE_HEADERS: Dict[str, str] = {"Cache-Control": POLL_CACHE_CONTROL}
@@ -7,14 +7,14 @@ Devices are configured in config/google_assistant_devices.toml.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict
 
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 def _get_service(request: Request):
@@ -23,54 +23,54 @@ def _get_service(request: Request):
 
 
 @router.get("/api/assistant/status")
-async def assistant_status(request: Request) -> JSONResponse:
+async def assistant_status(request: Request) -> ORJSONResponse:
     """Return Google Assistant integration status."""
     service = _get_service(request)
     if not service:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"ok": False, "enabled": False, "error": "Service not initialized"},
             status_code=200,
         )
 
-    return JSONResponse(content={"ok": True, **service.get_status()})
+    return ORJSONResponse(content={"ok": True, **service.get_status()})
 
 
 @router.get("/api/assistant/devices")
-async def assistant_devices(request: Request) -> JSONResponse:
+async def assistant_devices(request: Request) -> ORJSONResponse:
     """Return list of configured devices."""
     service = _get_service(request)
     if not service:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"ok": False, "devices": [], "error": "Service not initialized"},
             status_code=200,
         )
 
     devices = service.list_devices()
-    return JSONResponse(content={"ok": True, "devices": devices})
+    return ORJSONResponse(content={"ok": True, "devices": devices})
 
 
 @router.get("/api/assistant/device/{device_id}")
-async def assistant_device(request: Request, device_id: str) -> JSONResponse:
+async def assistant_device(request: Request, device_id: str) -> ORJSONResponse:
     """Return details for a specific device."""
     service = _get_service(request)
     if not service:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"ok": False, "error": "Service not initialized"},
             status_code=200,
         )
 
     device = service.get_device(device_id)
     if not device:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"ok": False, "error": f"Device not found: {device_id}"},
             status_code=404,
         )
 
-    return JSONResponse(content={"ok": True, "device": device})
+    return ORJSONResponse(content={"ok": True, "device": device})
 
 
 @router.post("/api/assistant/command")
-async def assistant_command(request: Request, payload: Dict[str, Any]) -> JSONResponse:
+async def assistant_command(request: Request, payload: Dict[str, Any]) -> ORJSONResponse:
     """Send a command to a device.
 
     Body:
@@ -80,7 +80,7 @@ async def assistant_command(request: Request, payload: Dict[str, Any]) -> JSONRe
     """
     service = _get_service(request)
     if not service:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"ok": False, "error": "Service not initialized"},
             status_code=200,
         )
@@ -90,24 +90,24 @@ async def assistant_command(request: Request, payload: Dict[str, Any]) -> JSONRe
     params = payload.get("params") or {}
 
     if not device_id:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"ok": False, "error": "Missing device_id"},
             status_code=400,
         )
 
     if not action:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"ok": False, "error": "Missing action"},
             status_code=400,
         )
 
     result = await service.send_command(device_id, action, params)
     status_code = 200 if result.get("ok") else 400
-    return JSONResponse(content=result, status_code=status_code)
+    return ORJSONResponse(content=result, status_code=status_code)
 
 
 @router.post("/api/assistant/custom")
-async def assistant_custom(request: Request, payload: Dict[str, Any]) -> JSONResponse:
+async def assistant_custom(request: Request, payload: Dict[str, Any]) -> ORJSONResponse:
     """Send a custom text command to Google Assistant.
 
     Body:
@@ -115,25 +115,25 @@ async def assistant_custom(request: Request, payload: Dict[str, Any]) -> JSONRes
     """
     service = _get_service(request)
     if not service:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"ok": False, "error": "Service not initialized"},
             status_code=200,
         )
 
     text = payload.get("text", "").strip()
     if not text:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"ok": False, "error": "Missing command text"},
             status_code=400,
         )
 
     result = await service.send_custom_text(text)
     status_code = 200 if result.get("ok") else 400
-    return JSONResponse(content=result, status_code=status_code)
+    return ORJSONResponse(content=result, status_code=status_code)
 
 
 @router.get("/api/assistant/history")
-async def assistant_history(request: Request, limit: int = 20) -> JSONResponse:
+async def assistant_history(request: Request, limit: int = 20) -> ORJSONResponse:
     """Return command history.
 
     Query params:
@@ -141,24 +141,24 @@ async def assistant_history(request: Request, limit: int = 20) -> JSONResponse:
     """
     service = _get_service(request)
     if not service:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"ok": False, "history": [], "error": "Service not initialized"},
             status_code=200,
         )
 
     history = service.get_history(limit=limit)
-    return JSONResponse(content={"ok": True, "history": history})
+    return ORJSONResponse(content={"ok": True, "history": history})
 
 
 @router.post("/api/assistant/reload")
-async def assistant_reload(request: Request) -> JSONResponse:
+async def assistant_reload(request: Request) -> ORJSONResponse:
     """Reload device configuration from file."""
     service = _get_service(request)
     if not service:
-        return JSONResponse(
+        return ORJSONResponse(
             content={"ok": False, "error": "Service not initialized"},
             status_code=200,
         )
 
     result = service.reload_config()
-    return JSONResponse(content=result)
+    return ORJSONResponse(content=result)
@@ -1,59 +1,30 @@
 """Control commands, resource management, and camera feed endpoints."""
 
-import asyncio
-import json
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 
+import orjson
 from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import JSONResponse, StreamingResponse
 
 from pc_client.adapters import RestAdapter
 from pc_client.providers import VisionProvider
+from pc_client.api.control_utils import (
+    local_feature_rows,
+    local_logic_summary,
+    local_motion_queue_snapshot,
+    normalize_feature_payload,
+    normalize_tracking_request,
+)
 from pc_client.api.sse_manager import SseManager
 
 if TYPE_CHECKING:
     from pc_client.core import ServiceManager
 
-LOCAL_FEATURE_BLUEPRINTS = [
-    {
-        "name": "s0_manual",
-        "scenario": "S0",
-        "title": "Stan 0 – Sterowanie ręczne",
-        "description": "Podstawowe usługi komunikacji i sterowania ręcznego.",
-        "units": [
-            "rider-cam-preview.service",
-            "rider-edge-preview.service",
-        ],
-        "aliases": ["zero_mode"],
-        "state_key": "zero",
-    },
-    {
-        "name": "s3_follow_me_face",
-        "scenario": "S3",
-        "title": "Śledzenie (twarz)",
-        "description": "Tracker oraz kontroler ruchu związanego z trybem Follow Me.",
-        "units": [
-            "rider-tracker.service",
-            "rider-tracking-controller.service",
-        ],
-        "aliases": ["face_tracking"],
-        "state_key": "tracking",
-    },
-    {
-        "name": "s4_recon",
-        "scenario": "S4",
-        "title": "Rekonesans autonomiczny",
-        "description": "Navigator + odometria i procesy mapowania.",
-        "units": [
-            "rider-vision.service",
-        ],
-        "aliases": ["recon"],
-        "state_key": "recon",
-    },
-]
+_SSE_DATA_PREFIX = b"data: "
+_SSE_TERMINATOR = b"\n\n"
 
 logger = logging.getLogger(__name__)
 
@@ -66,11 +37,13 @@ async def proxy_remote_media(request: Request, remote_path: str) -> Response:
     if adapter is None:
         raise HTTPException(status_code=503, detail="REST adapter not initialized")
 
-    params = dict(request.query_params)
+    # multi_items() keeps repeated keys (?tag=a&tag=b) that dict() would collapse.
+    params = tuple(request.query_params.multi_items())
     try:
         content, media_type, remote_headers = await adapter.fetch_binary(remote_path, params=params)
-        headers = {key: value for key, value in remote_headers.items() if key.lower() != "content-type"}
-        return Response(content=content, media_type=media_type, headers=headers)
+        # Explicit content-type with media_type=None skips Starlette's charset handling.
+        remote_headers["content-type"] = media_type
+        return Response(content=content, headers=remote_headers)
     except Exception as e:
         logger.error(f"Failed to proxy {remote_path}: {e}")
         raise HTTPException(status_code=502, detail="Unable to fetch remote media")
@@ -96,10 +69,11 @@ async def vision_tracker_proxy(request: Request):
         overlay, ts, fps = provider.get_tracker_snapshot()
         if overlay:
             headers = {
+                "content-type": "image/png",
                 "X-Tracker-FPS": f"{fps:.1f}",
                 "X-Tracker-TS": f"{ts:.3f}",
             }
-            return Response(content=overlay, media_type="image/png", headers=headers)
+            return Response(content=overlay, headers=headers)
     return await proxy_remote_media(request, "/vision/tracker")
 
 
@@ -109,21 +83,35 @@ async def snapshots_proxy(request: Request, snapshot_path: str):
     return await proxy_remote_media(request, f"/snapshots/{snapshot_path}")
 
 
-def _normalize_tracking_request(payload: Dict[str, Any]) -> tuple[str, bool]:
-    """Validate and normalize tracking payload similar to Rider-PI."""
-    raw_mode = str(payload.get("mode", "none")).strip().lower()
-    if raw_mode not in {"face", "hand", "none"}:
-        raise HTTPException(status_code=400, detail=f"Invalid tracking mode '{raw_mode}'")
-    enabled = bool(payload.get("enabled", raw_mode in {"face", "hand"}))
-    if not enabled:
-        raw_mode = "none"
-    return raw_mode, raw_mode != "none"
+def _touch_control_state(request: Request) -> None:
+    """Invalidate the serialized control-state snapshot after a mutation."""
+    state = request.app.state
+    state.control_state_version = getattr(state, "control_state_version", 0) + 1
+
+
+def _control_state_prefix(request: Request) -> bytes:
+    """Return the serialized control state, open-ended for a trailing ``updated_at`` field.
+
+    Serialization happens only when ``control_state_version`` changed since the last call.
+    """
+    state = request.app.state
+    version = getattr(state, "control_state_version", 0)
+    snapshot: Optional[Tuple[int, bytes]] = getattr(state, "control_state_snapshot", None)
+    if snapshot is None or snapshot[0] != version:
+        fields = {key: value for key, value in state.control_state.items() if key != "updated_at"}
+        # OPT_NON_STR_KEYS keeps stdlib json's tolerance for int/bool keys in Rider-PI state
+        body = orjson.dumps(fields, option=orjson.OPT_NON_STR_KEYS)
+        prefix = body[:-1] + b"," if fields else b"{"
+        snapshot = (version, prefix)
+        state.control_state_snapshot = snapshot
+    return snapshot[1]
 
 
 def _set_local_tracking_state(request: Request, mode: str, enabled: bool) -> Dict[str, Any]:
     """Update local tracking state cache + emit SSE."""
     state = {"mode": mode, "enabled": enabled}
     request.app.state.control_state["tracking"] = state
+    _touch_control_state(request)
     _publish_event(request, "motion.bridge.event", {"event": "tracking_mode", "detail": state})
     return {"ok": True, **state}
 
@@ -152,97 +140,57 @@ def _emit_system_log(request: Request, level: str, action: str, unit: str, error
     _publish_event(request, "system.log", {"level": level, "message": message})
 
 
-def _feature_state_flags(control_state: Dict[str, Any]) -> Tuple[bool, bool]:
-    tracking = control_state.get("tracking", {}) or {}
-    tracking_enabled = bool(tracking.get("enabled"))
-    recon = control_state.get("navigator", {}) or {}
-    recon_active = bool(recon.get("active"))
-    return tracking_enabled, recon_active
-
-
-def _is_feature_active(blueprint: Dict[str, Any], tracking_enabled: bool, recon_active: bool) -> bool:
-    key = blueprint.get("state_key")
-    if key == "tracking":
-        return tracking_enabled
-    if key == "recon":
-        return recon_active
-    if key == "zero":
-        return not tracking_enabled and not recon_active
-    return False
-
-
-def _service_entry(unit: str, services: List[Dict[str, Any]]) -> Dict[str, Any]:
-    data = next((svc for svc in services if svc.get("unit") == unit), None) or {"unit": unit}
-    active = str(data.get("active", "")).lower()
-    enabled = str(data.get("enabled", "")).lower()
-    return {
-        "unit": unit,
-        "desc": data.get("desc", ""),
-        "active": data.get("active"),
-        "sub": data.get("sub"),
-        "enabled": data.get("enabled"),
-        "is_active": active.startswith("active"),
-        "is_enabled": enabled.startswith("enabled"),
-    }
+def _remote_ok(result: Any) -> bool:
+    """Return True for a non-empty Rider-PI payload without an error marker."""
+    return isinstance(result, dict) and bool(result) and not result.get("error")
+
+
+async def _fetch_remote(
+    request: Request,
+    method_name: str,
+    *args: Any,
+    ok: Callable[[Any], bool] = _remote_ok,
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Call ``adapter.<method_name>(*args)`` when the REST adapter is available.
+
+    Returns ``(payload, None)`` when ``ok(payload)`` holds, otherwise ``(None, error)``
+    where ``error`` is the remote/transport error message (``None`` without an adapter).
+    """
+    adapter: Optional[RestAdapter] = request.app.state.rest_adapter
+    if adapter is None:
+        return None, None
+    try:
+        result = await getattr(adapter, method_name)(*args)
+    except Exception as exc:  # pragma: no cover - network failure
+        logger.error("Rider-PI call %s failed: %s", method_name, exc)
+        return None, str(exc)
+    if ok(result):
+        return result, None
+    error = result.get("error") if isinstance(result, dict) else None
+    if error:
+        logger.warning("Rider-PI call %s returned error: %s", method_name, error)
+    return None, str(error) if error else None
+
+
+async def _remote_or(
+    request: Request,
+    method_name: str,
+    local_builder: Callable[[], Dict[str, Any]],
+    *,
+    ok: Callable[[Any], bool] = _remote_ok,
+) -> JSONResponse:
+    """Return the Rider-PI payload for ``method_name`` or fall back to ``local_builder()``."""
+    remote, _ = await _fetch_remote(request, method_name, ok=ok)
+    return JSONResponse(remote if remote is not None else local_builder())
 
 
 def _local_feature_rows(request: Request) -> List[Dict[str, Any]]:
-    services = request.app.state.services or []
-    tracking_enabled, recon_active = _feature_state_flags(request.app.state.control_state)
-    rows: List[Dict[str, Any]] = []
-    for blueprint in LOCAL_FEATURE_BLUEPRINTS:
-        units = blueprint.get("units", [])
-        svc_entries = [_service_entry(unit, services) for unit in units]
-        row = {
-            "name": blueprint["name"],
-            "scenario": blueprint.get("scenario"),
-            "title": blueprint.get("title"),
-            "description": blueprint.get("description"),
-            "aliases": blueprint.get("aliases", []),
-            "services": svc_entries,
-            "active": _is_feature_active(blueprint, tracking_enabled, recon_active),
-        }
-        rows.append(row)
-    return rows
+    return local_feature_rows(request.app.state.services, request.app.state.control_state)
 
 
 def _local_logic_summary(request: Request) -> Dict[str, Any]:
-    features = _local_feature_rows(request)
-    summary_rows: List[Dict[str, Any]] = []
-    active_names: List[str] = []
-    partial_names: List[str] = []
-    for row in features:
-        services = row.get("services", [])
-        total = len(services)
-        active_count = sum(1 for svc in services if svc.get("is_active"))
-        if row.get("active"):
-            status = "active"
-            active_names.append(row["name"])
-        elif active_count:
-            status = "partial"
-            partial_names.append(row["name"])
-        else:
-            status = "inactive"
-        summary_rows.append(
-            {
-                "name": row["name"],
-                "scenario": row.get("scenario"),
-                "title": row.get("title"),
-                "description": row.get("description"),
-                "active": row.get("active", False),
-                "status": status,
-                "services_total": total,
-                "services_active": active_count,
-                "aliases": row.get("aliases", []),
-            }
-        )
-    payload = {
-        "features": summary_rows,
-        "active": active_names,
-        "partial": partial_names,
-        "counts": {"total": len(summary_rows), "active": len(active_names), "partial": len(partial_names)},
-    }
-    return {"ok": True, "summary": payload}
+    return local_logic_summary(request.app.state.services, request.app.state.control_state)
 
 
 @router.post("/api/control")
@@ -296,62 +244,29 @@ async def api_control_endpoint(request: Request, command: Dict[str, Any]) -> JSO
     return JSONResponse(response_payload, status_code=status_code if not forward_ok else 200)
 
 
-def _local_motion_queue_snapshot(entries: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
-    """Return motion queue items based on locally captured commands."""
-    now = time.time()
-    items: List[Dict[str, Any]] = []
-    for entry in reversed(entries or []):
-        cmd = entry.get("command", {}) if isinstance(entry, dict) else {}
-        ts = entry.get("ts", 0) if isinstance(entry, dict) else 0
-        items.append(
-            {
-                "source": cmd.get("source") or cmd.get("provider") or "pc-ui",
-                "vx": cmd.get("vx"),
-                "vy": cmd.get("vy"),
-                "yaw": cmd.get("yaw"),
-                "time_s": cmd.get("t"),
-                "status": cmd.get("status") or cmd.get("cmd"),
-                "age_s": round(max(0.0, now - ts), 2) if ts else None,
-            }
-        )
-    return {"items": items}
-
-
 @router.get("/api/motion/queue")
 async def api_motion_queue(request: Request) -> JSONResponse:
     """Expose the latest motion queue entries from Rider-PI, with a local fallback."""
-    adapter: Optional[RestAdapter] = request.app.state.rest_adapter
-    if adapter:
-        try:
-            remote_queue = await adapter.get_motion_queue()
-            if isinstance(remote_queue, dict):
-                if remote_queue.get("error"):
-                    logger.warning("Remote motion queue returned error: %s", remote_queue["error"])
-                elif "items" in remote_queue:
-                    return JSONResponse(remote_queue)
-        except Exception as exc:  # pragma: no cover - network failure
-            logger.error("Failed to fetch motion queue from Rider-PI: %s", exc)
-
-    return JSONResponse(_local_motion_queue_snapshot(request.app.state.motion_queue))
+    return await _remote_or(
+        request,
+        "get_motion_queue",
+        lambda: local_motion_queue_snapshot(request.app.state.motion_queue),
+        ok=lambda remote: _remote_ok(remote) and "items" in remote,
+    )
 
 
 @router.get("/api/control/state")
-async def api_control_state(request: Request) -> JSONResponse:
+async def api_control_state(request: Request) -> Response:
     """Return current control state, preferring Rider-PI data."""
-    adapter: Optional[RestAdapter] = request.app.state.rest_adapter
-    state = dict(request.app.state.control_state)
-    if adapter:
-        try:
-            remote_state = await adapter.get_control_state()
-            if isinstance(remote_state, dict) and "error" not in remote_state:
-                state = remote_state
-                request.app.state.control_state.update(remote_state)
-            else:
-                logger.warning("Falling back to local control state: %s", remote_state.get("error"))
-        except Exception as exc:  # pragma: no cover - defensive
-            logger.error("Failed to fetch control state from Rider-PI: %s", exc)
-    state["updated_at"] = time.time()
-    return JSONResponse(content=state)
+    remote_state, _ = await _fetch_remote(request, "get_control_state")
+    if remote_state is not None:
+        request.app.state.control_state.update(remote_state)
+        _touch_control_state(request)
+        state = dict(remote_state)
+        state["updated_at"] = time.time()
+        return JSONResponse(content=state)
+    body = b"".join((_control_state_prefix(request), b'"updated_at":', repr(time.time()).encode(), b"}"))
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/api/vision/tracking/mode")
@@ -375,16 +290,28 @@ async def update_tracking_mode(request: Request, payload: Dict[str, Any]) -> JSO
             _set_local_tracking_state(request, mode, enabled)
         return JSONResponse(result, status_code=status_code)
 
-    mode, enabled = _normalize_tracking_request(body)
+    try:
+        mode, enabled = normalize_tracking_request(body)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     result = _set_local_tracking_state(request, mode, enabled)
     return JSONResponse(result)
 
 
-def _normalize_feature_payload(name: str, payload: Dict[str, Any]) -> Tuple[str, bool]:
-    """Normalize feature toggle payload for local fallback."""
-    normalized = str(name or "").strip().lower()
-    enabled = bool(payload.get("enabled"))
-    return normalized, enabled
+def _set_local_recon_state(request: Request, enabled: bool) -> Dict[str, Any]:
+    """Update local navigator cache for the recon feature."""
+    navigator = request.app.state.control_state.get("navigator", {}) or {}
+    navigator.update({"active": enabled})
+    request.app.state.control_state["navigator"] = navigator
+    _touch_control_state(request)
+    return navigator
+
+
+_LOCAL_FEATURE_HANDLERS: Dict[str, Callable[[Request, bool], Dict[str, Any]]] = {
+    "face_tracking": lambda request, enabled: _set_local_tracking_state(request, "face", enabled),
+    "hand_tracking": lambda request, enabled: _set_local_tracking_state(request, "hand", enabled),
+    "recon": _set_local_recon_state,
+}
 
 
 @router.post("/api/logic/feature/{name}")
@@ -406,58 +333,34 @@ async def feature_toggle(request: Request, name: str, payload: Dict[str, Any]) -
         # best-effort local cache update
         try:
             feature = str(result.get("feature") or name).lower()
-            enabled = bool(body.get("enabled"))
-            if feature in {"face_tracking", "hand_tracking"}:
-                mode = "hand" if feature == "hand_tracking" else "face"
-                _set_local_tracking_state(request, mode, enabled)
-            elif feature == "recon":
-                navigator = request.app.state.control_state.get("navigator", {}) or {}
-                navigator.update({"active": enabled})
-                request.app.state.control_state["navigator"] = navigator
+            handler = _LOCAL_FEATURE_HANDLERS.get(feature)
+            if handler is not None:
+                handler(request, bool(body.get("enabled")))
         except Exception:
             pass
         return JSONResponse(result, status_code=status_code)
 
     # local fallback without remote adapter
-    feature_name, enabled = _normalize_feature_payload(name, body)
-    if feature_name in {"face_tracking", "hand_tracking"}:
-        mode = "hand" if feature_name == "hand_tracking" else "face"
-        local = _set_local_tracking_state(request, mode, enabled)
-        return JSONResponse({"ok": True, "feature": feature_name, "enabled": enabled, "result": local})
-    if feature_name == "recon":
-        navigator = request.app.state.control_state.get("navigator", {}) or {}
-        navigator.update({"active": enabled})
-        request.app.state.control_state["navigator"] = navigator
-    return JSONResponse({"ok": True, "feature": feature_name, "enabled": enabled, "result": navigator})
-    return JSONResponse({"ok": False, "error": "unknown_feature", "feature": feature_name}, status_code=404)
+    feature_name, enabled = normalize_feature_payload(name, body)
+    handler = _LOCAL_FEATURE_HANDLERS.get(feature_name)
+    if handler is None:
+        return JSONResponse({"ok": False, "error": "unknown_feature", "feature": feature_name}, status_code=404)
+    local = handler(request, enabled)
+    return JSONResponse({"ok": True, "feature": feature_name, "enabled": enabled, "result": local})
 
 
 @router.get("/api/logic/features")
 async def logic_features(request: Request) -> JSONResponse:
     """Expose Rider-PI logic feature registry or local fallback."""
-    adapter: Optional[RestAdapter] = request.app.state.rest_adapter
-    if adapter:
-        try:
-            remote = await adapter.get_logic_features()
-            if isinstance(remote, dict) and not remote.get("error"):
-                return JSONResponse(remote)
-        except Exception as exc:  # pragma: no cover - defensive network handling
-            logger.error("Failed to fetch logic features: %s", exc)
-    return JSONResponse({"ok": True, "features": _local_feature_rows(request)})
+    return await _remote_or(
+        request, "get_logic_features", lambda: {"ok": True, "features": _local_feature_rows(request)}
+    )
 
 
 @router.get("/api/logic/summary")
 async def logic_summary(request: Request) -> JSONResponse:
     """Expose Rider-PI summary endpoint or local fallback."""
-    adapter: Optional[RestAdapter] = request.app.state.rest_adapter
-    if adapter:
-        try:
-            remote = await adapter.get_logic_summary()
-            if isinstance(remote, dict) and not remote.get("error"):
-                return JSONResponse(remote)
-        except Exception as exc:  # pragma: no cover
-            logger.error("Failed to fetch logic summary: %s", exc)
-    return JSONResponse(_local_logic_summary(request))
+    return await _remote_or(request, "get_logic_summary", lambda: _local_logic_summary(request))
 
 
 @router.post("/api/navigator/start")
@@ -465,6 +368,7 @@ async def navigator_start(request: Request, payload: Dict[str, Any]) -> JSONResp
     """Start navigator with selected strategy."""
     strategy = payload.get("strategy", "standard")
     request.app.state.control_state["navigator"] = {"active": True, "strategy": strategy, "state": "navigating"}
+    _touch_control_state(request)
     _publish_event(request, "navigator.start", {"strategy": strategy})
     return JSONResponse({"ok": True, "strategy": strategy})
 
@@ -474,6 +378,7 @@ async def navigator_stop(request: Request) -> JSONResponse:
     """Stop navigator."""
     strategy = request.app.state.control_state.get("navigator", {}).get("strategy", "standard")
     request.app.state.control_state["navigator"] = {"active": False, "strategy": strategy, "state": "idle"}
+    _touch_control_state(request)
     _publish_event(request, "navigator.stop", {})
     return JSONResponse({"ok": True})
 
@@ -488,6 +393,7 @@ async def navigator_return_home(request: Request) -> JSONResponse:
         "state": "returning",
     }
     request.app.state.control_state["navigator"] = navigator_state
+    _touch_control_state(request)
     _publish_event(request, "navigator.return_home", {})
     return JSONResponse({"ok": True, "state": "returning"})
 
@@ -499,23 +405,14 @@ async def get_resource_status(request: Request, resource_name: str) -> JSONRespo
     if not local_resource:
         return JSONResponse({"error": f"Resource {resource_name} not found"}, status_code=404)
 
-    adapter: RestAdapter = request.app.state.rest_adapter
+    remote_data, error = await _fetch_remote(request, "get_resource", resource_name)
     result: Dict[str, Any]
-    if adapter:
-        try:
-            remote_data = await adapter.get_resource(resource_name)
-            if remote_data and not remote_data.get("error"):
-                result = remote_data
-            else:
-                result = dict(local_resource)
-                if remote_data and remote_data.get("error"):
-                    result["error"] = remote_data["error"]
-        except Exception as exc:  # pragma: no cover - defensive network error
-            logger.error("Error fetching resource %s from Rider-PI: %s", resource_name, exc)
-            result = dict(local_resource)
-            result["error"] = str(exc)
+    if remote_data is not None:
+        result = remote_data
     else:
         result = dict(local_resource)
+        if error:
+            result["error"] = error
 
     result.setdefault("checked_at", time.time())
     return JSONResponse(content=result)
@@ -562,12 +459,9 @@ async def list_services(request: Request) -> JSONResponse:
         return JSONResponse(result)
 
     # Fallback to old behavior if ServiceManager not available
-    adapter: Optional[RestAdapter] = request.app.state.rest_adapter
-    if adapter:
-        remote = await adapter.get_services()
-        if remote and not remote.get("error"):
-            return JSONResponse(remote)
-        logger.warning("Falling back to local /svc list: %s", remote.get("error") if remote else "unknown error")
+    remote, _ = await _fetch_remote(request, "get_services")
+    if remote is not None:
+        return JSONResponse(remote)
 
     services = [{**svc, "ts": time.time()} for svc in request.app.state.services]
     return JSONResponse({"services": services, "timestamp": time.time()})
@@ -676,21 +570,23 @@ def _camera_last_headers(request: Request) -> Dict[str, str]:
 @router.get("/camera/last")
 async def camera_last(request: Request) -> Response:
     """Return last camera frame placeholder."""
+    frame = request.app.state.last_camera_frame
     headers = _camera_last_headers(request)
-    media_type = request.app.state.last_camera_frame.get("media_type", "image/png")
-    return Response(
-        content=request.app.state.last_camera_frame["content"],
-        media_type=media_type,
-        headers=headers,
-    )
+    headers["content-type"] = frame.get("media_type", "image/png")
+    return Response(content=frame["content"], headers=headers)
 
 
 @router.head("/camera/last")
 async def camera_last_head(request: Request) -> Response:
-    """HEAD variant for last camera frame."""
+    """HEAD variant for last camera frame (metadata only, frame bytes are never touched)."""
+    frame = request.app.state.last_camera_frame
     headers = _camera_last_headers(request)
-    media_type = request.app.state.last_camera_frame.get("media_type", "image/png")
-    return Response(content=b"", media_type=media_type, headers=headers)
+    length = frame.get("length")
+    if length is None:
+        length = len(frame.get("content") or b"")
+    headers["Content-Length"] = str(length)
+    headers["content-type"] = frame.get("media_type", "image/png")
+    return Response(headers=headers)
 
 
 @router.get("/events")
@@ -700,15 +596,13 @@ async def events(request: Request):
     queue = manager.subscribe()
 
     async def event_generator():
+        # Heartbeats arrive through the queue from the shared lifecycle task every
+        # few seconds, which also bounds how long a disconnect goes unnoticed.
         try:
-            while True:
-                if await request.is_disconnected():
-                    break
-                try:
-                    payload = await asyncio.wait_for(queue.get(), timeout=5.0)
-                except asyncio.TimeoutError:
-                    payload = {"topic": "heartbeat", "data": {"status": "ok"}, "ts": time.time()}
-                yield f"data: {json.dumps(payload)}\n\n"
+            while not await request.is_disconnected():
+                payload = await queue.get()
+                data = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+                yield b"".join((_SSE_DATA_PREFIX, data, _SSE_TERMINATOR))
         finally:
             manager.unsubscribe(queue)
 
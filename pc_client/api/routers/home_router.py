@@ -2,152 +2,372 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import functools
+import sys
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from starlette.datastructures import State
 
 from pc_client.adapters import RestAdapter
+from pc_client.api.response_utils import POLL_CACHE_HEADERS
+from pc_client.config import Settings
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
+# SDM trait/command names are interned so dict probes on them compare by identity.
+TRAIT_ON_OFF = sys.intern("sdm.devices.traits.OnOff")
+TRAIT_BRIGHTNESS = sys.intern("sdm.devices.traits.Brightness")
+TRAIT_COLOR_SETTING = sys.intern("sdm.devices.traits.ColorSetting")
+TRAIT_THERMOSTAT_MODE = sys.intern("sdm.devices.traits.ThermostatMode")
+TRAIT_THERMOSTAT_SETPOINT = sys.intern("sdm.devices.traits.ThermostatTemperatureSetpoint")
+TRAIT_TEMPERATURE = sys.intern("sdm.devices.traits.Temperature")
+TRAIT_START_STOP = sys.intern("sdm.devices.traits.StartStop")
+TRAIT_DOCK = sys.intern("sdm.devices.traits.Dock")
 
-def _home_state(app) -> Dict[str, Any]:
-    state = getattr(app.state, "home_state", None)
-    if isinstance(state, dict):
-        return state
-    default = {"authenticated": False, "profile": {"email": "unknown@mock.local"}, "scopes": []}
-    app.state.home_state = default
-    return default
+CMD_ON_OFF = sys.intern("action.devices.commands.OnOff")
+CMD_BRIGHTNESS_ABSOLUTE = sys.intern("action.devices.commands.BrightnessAbsolute")
+CMD_COLOR_ABSOLUTE = sys.intern("action.devices.commands.ColorAbsolute")
+CMD_THERMOSTAT_SETPOINT = sys.intern("action.devices.commands.ThermostatTemperatureSetpoint")
+CMD_START_STOP = sys.intern("action.devices.commands.StartStop")
+CMD_PAUSE_UNPAUSE = sys.intern("action.devices.commands.PauseUnpause")
+CMD_DOCK = sys.intern("action.devices.commands.Dock")
 
+# Static body of the local mock auth success response, serialized once at import.
+_LOCAL_AUTH_OK_BODY = orjson.dumps({"ok": True, "note": "local mock auth"})
 
-def _home_devices(app) -> Dict[str, Any]:
-    devices = getattr(app.state, "home_devices", None)
-    if isinstance(devices, list):
-        return {"ok": True, "devices": devices}
-    payload = {
-        "ok": True,
-        "devices": [
-            {
-                "name": "devices/light/living-room",
-                "type": "action.devices.types.LIGHT",
-                "traits": {
-                    "sdm.devices.traits.OnOff": {"on": True},
-                    "sdm.devices.traits.Brightness": {"brightness": 72},
-                    "sdm.devices.traits.ColorSetting": {"color": {"temperatureK": 3200}},
-                },
+# Auth state reported until the local mock auth handshake runs; never modified in place.
+_DEFAULT_HOME_STATE: Dict[str, Any] = {
+    "authenticated": False,
+    "profile": {"email": "unknown@mock.local"},
+    "scopes": [],
+}
+_DEFAULT_HOME_STATE_JSON = orjson.dumps(_DEFAULT_HOME_STATE)
+
+# Mock device list served until a command mutates it; never modified in place.
+_DEFAULT_DEVICES_PAYLOAD: Dict[str, Any] = {
+    "ok": True,
+    "devices": [
+        {
+            "name": "devices/light/living-room",
+            "type": "action.devices.types.LIGHT",
+            "traits": {
+                TRAIT_ON_OFF: {"on": True},
+                TRAIT_BRIGHTNESS: {"brightness": 72},
+                TRAIT_COLOR_SETTING: {"color": {"temperatureK": 3200}},
             },
-            {
-                "name": "devices/thermostat/hall",
-                "type": "action.devices.types.THERMOSTAT",
-                "traits": {
-                    "sdm.devices.traits.ThermostatMode": {"mode": "heatcool"},
-                    "sdm.devices.traits.ThermostatTemperatureSetpoint": {"heatCelsius": 20.0, "coolCelsius": 24.0},
-                    "sdm.devices.traits.Temperature": {"ambientTemperatureCelsius": 21.5},
-                },
+        },
+        {
+            "name": "devices/thermostat/hall",
+            "type": "action.devices.types.THERMOSTAT",
+            "traits": {
+                TRAIT_THERMOSTAT_MODE: {"mode": "heatcool"},
+                TRAIT_THERMOSTAT_SETPOINT: {"heatCelsius": 20.0, "coolCelsius": 24.0},
+                TRAIT_TEMPERATURE: {"ambientTemperatureCelsius": 21.5},
             },
-            {
-                "name": "devices/vacuum/dusty",
-                "type": "action.devices.types.VACUUM",
-                "traits": {
-                    "sdm.devices.traits.StartStop": {"isRunning": False, "isPaused": False},
-                    "sdm.devices.traits.Dock": {"available": True},
-                },
+        },
+        {
+            "name": "devices/vacuum/dusty",
+            "type": "action.devices.types.VACUUM",
+            "traits": {
+                TRAIT_START_STOP: {"isRunning": False, "isPaused": False},
+                TRAIT_DOCK: {"available": True},
             },
-        ],
-    }
-    app.state.home_devices = payload["devices"]
-    return payload
-
-
-def _apply_local_command(app, payload: Dict[str, Any]) -> Dict[str, Any]:
-    devices = getattr(app.state, "home_devices", []) or []
-    device_id = payload.get("deviceId")
-    command = payload.get("command")
-    params = payload.get("params") or {}
-    target = next((d for d in devices if d.get("name") == device_id), None)
+        },
+    ],
+}
+_DEFAULT_DEVICES_JSON = orjson.dumps(_DEFAULT_DEVICES_PAYLOAD)
+
+
+class HomeCommandRequest(BaseModel):
+    """Request body for a Google Home device command."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    deviceId: str = ""
+    command: str = ""
+    params: Optional[Dict[str, Any]] = None
+
+
+def _home_state(app_state: State) -> Dict[str, Any]:
+    """Return the mutable local auth state, seeding it from the defaults on first use."""
+    state = getattr(app_state, "home_state", None)
+    if isinstance(state, dict):
+        return state
+    state = copy.deepcopy(_DEFAULT_HOME_STATE)
+    app_state.home_state = state
+    return state
+
+
+def _home_devices(app_state: State) -> List[Dict[str, Any]]:
+    """Return the mutable local device list, seeding it from the defaults on first use."""
+    devices = getattr(app_state, "home_devices", None)
+    if isinstance(devices, list):
+        return devices
+    devices = copy.deepcopy(_DEFAULT_DEVICES_PAYLOAD["devices"])
+    app_state.home_devices = devices
+    return devices
+
+
+def _local_devices_body(app_state: State, devices: List[Dict[str, Any]]) -> bytes:
+    """Return the serialized local device list, re-encoded only after a reassignment or command.
+
+    In-place edits must bump ``home_devices_version`` to be picked up.
+    """
+    version = getattr(app_state, "home_devices_version", 0)
+    cached: Optional[Tuple[List[Dict[str, Any]], int, bytes]] = getattr(app_state, "home_devices_body", None)
+    if cached is None or cached[0] is not devices or cached[1] != version:
+        cached = (devices, version, orjson.dumps({"ok": True, "devices": devices}))
+        app_state.home_devices_body = cached
+    return cached[2]
+
+
+# Optional RestAdapter coroutines used by the Google Home proxy endpoints.
+_ADAPTER_METHOD_NAMES = ("get_home_status", "get_home_devices", "post_home_command", "post_home_auth")
+
+
+def _adapter_methods(app_state: State) -> Dict[str, Optional[Callable[..., Awaitable[Any]]]]:
+    """Return the adapter's Google Home coroutines, re-resolved only when ``rest_adapter`` is replaced."""
+    adapter: Optional[RestAdapter] = app_state.rest_adapter
+    cached = getattr(app_state, "home_adapter_methods", None)
+    if cached is None or cached[0] is not adapter:
+        cached = (adapter, {name: getattr(adapter, name, None) for name in _ADAPTER_METHOD_NAMES})
+        app_state.home_adapter_methods = cached
+    return cached[1]
+
+
+def _response_cache(app_state: State) -> Dict[str, Tuple[float, bytes]]:
+    cache = getattr(app_state, "home_response_cache", None)
+    if cache is None:
+        cache = app_state.home_response_cache = {}
+    return cache
+
+
+def _cached_response(app_state: State, key: str) -> Optional[Response]:
+    """Return a still-fresh cached upstream body for ``key``, if any."""
+    entry = _response_cache(app_state).get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return Response(content=entry[1], media_type="application/json", headers=POLL_CACHE_HEADERS)
+
+
+def _cache_response(app_state: State, key: str, content: Dict[str, Any], ttl: float, generation: int) -> Response:
+    """Serialize ``content`` once and keep the bytes for ``ttl`` seconds.
+
+    Nothing is stored if a write invalidated the cache after the read started (``generation`` moved on).
+    """
+    body = orjson.dumps(content)
+    if ttl > 0 and generation == getattr(app_state, "home_cache_generation", 0):
+        _response_cache(app_state)[key] = (time.monotonic() + ttl, body)
+    return Response(content=body, media_type="application/json", headers=POLL_CACHE_HEADERS)
+
+
+def _inflight_reads(app_state: State) -> Dict[str, "asyncio.Future[Any]"]:
+    inflight = getattr(app_state, "home_inflight_reads", None)
+    if inflight is None:
+        inflight = app_state.home_inflight_reads = {}
+    return inflight
+
+
+def _drop_inflight(inflight: Dict[str, "asyncio.Future[Any]"], key: str, task: "asyncio.Future[Any]") -> None:
+    if inflight.get(key) is task:
+        del inflight[key]
+    if not task.cancelled():
+        task.exception()  # mark retrieved even if every waiter went away
+
+
+async def _fetch_once(app_state: State, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Await ``fetch()``, sharing a single upstream call between concurrent cache misses on ``key``."""
+    inflight = _inflight_reads(app_state)
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(fetch())
+        inflight[key] = task
+        task.add_done_callback(functools.partial(_drop_inflight, inflight, key))
+    return await asyncio.shield(task)
+
+
+def _invalidate_reads(app_state: State) -> None:
+    """Forget cached and in-flight upstream reads; called both before and after an upstream write."""
+    _response_cache(app_state).clear()
+    _inflight_reads(app_state).clear()
+    app_state.home_cache_generation = getattr(app_state, "home_cache_generation", 0) + 1
+
+
+def _cmd_on_off(traits: Dict[str, Any], params: Dict[str, Any]) -> None:
+    traits.setdefault(TRAIT_ON_OFF, {})["on"] = bool(params.get("on"))
+
+
+def _cmd_brightness_absolute(traits: Dict[str, Any], params: Dict[str, Any]) -> None:
+    traits.setdefault(TRAIT_BRIGHTNESS, {})["brightness"] = int(params.get("brightness", 0))
+
+
+def _cmd_color_absolute(traits: Dict[str, Any], params: Dict[str, Any]) -> None:
+    traits.setdefault(TRAIT_COLOR_SETTING, {})["color"] = params.get("color", {})
+
+
+def _cmd_thermostat_setpoint(traits: Dict[str, Any], params: Dict[str, Any]) -> None:
+    traits.setdefault(TRAIT_THERMOSTAT_SETPOINT, {}).update(params)
+
+
+def _cmd_start_stop(traits: Dict[str, Any], params: Dict[str, Any]) -> None:
+    traits.setdefault(TRAIT_START_STOP, {}).update({"isRunning": bool(params.get("start")), "isPaused": False})
+
+
+def _cmd_pause_unpause(traits: Dict[str, Any], params: Dict[str, Any]) -> None:
+    traits.setdefault(TRAIT_START_STOP, {}).update({"isPaused": bool(params.get("pause"))})
+
+
+def _cmd_dock(traits: Dict[str, Any], params: Dict[str, Any]) -> None:
+    traits.setdefault(TRAIT_DOCK, {})["lastDockTs"] = time.time()
+
+
+_COMMAND_HANDLERS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], None]] = {
+    CMD_ON_OFF: _cmd_on_off,
+    CMD_BRIGHTNESS_ABSOLUTE: _cmd_brightness_absolute,
+    CMD_COLOR_ABSOLUTE: _cmd_color_absolute,
+    CMD_THERMOSTAT_SETPOINT: _cmd_thermostat_setpoint,
+    CMD_START_STOP: _cmd_start_stop,
+    CMD_PAUSE_UNPAUSE: _cmd_pause_unpause,
+    CMD_DOCK: _cmd_dock,
+}
+
+
+def _device_index(app_state: State) -> Dict[Optional[str], Dict[str, Any]]:
+    """Return a name -> device index, rebuilt only when ``home_devices`` is reassigned."""
+    devices = _home_devices(app_state)
+    cached = getattr(app_state, "home_devices_index", None)
+    if cached is None or cached[0] is not devices:
+        # reversed() so the first device wins on duplicate names, like a linear scan.
+        cached = (devices, {device.get("name"): device for device in reversed(devices)})
+        app_state.home_devices_index = cached
+    return cached[1]
+
+
+def _apply_local_command(app_state: State, body: HomeCommandRequest) -> Dict[str, Any]:
+    device_id = body.deviceId
+    command = body.command
+    params = body.params or {}
+    target = _device_index(app_state).get(device_id)
     if not target:
         return {"ok": False, "error": "device_not_found"}
 
     traits = target.setdefault("traits", {})
-    if command == "action.devices.commands.OnOff":
-        traits.setdefault("sdm.devices.traits.OnOff", {})["on"] = bool(params.get("on"))
-    elif command == "action.devices.commands.BrightnessAbsolute":
-        traits.setdefault("sdm.devices.traits.Brightness", {})["brightness"] = int(params.get("brightness", 0))
-    elif command == "action.devices.commands.ColorAbsolute":
-        traits.setdefault("sdm.devices.traits.ColorSetting", {})["color"] = params.get("color", {})
-    elif command == "action.devices.commands.ThermostatTemperatureSetpoint":
-        traits.setdefault("sdm.devices.traits.ThermostatTemperatureSetpoint", {}).update(params)
-    elif command == "action.devices.commands.StartStop":
-        traits.setdefault("sdm.devices.traits.StartStop", {}).update(
-            {"isRunning": bool(params.get("start")), "isPaused": False}
-        )
-    elif command == "action.devices.commands.PauseUnpause":
-        traits.setdefault("sdm.devices.traits.StartStop", {}).update({"isPaused": bool(params.get("pause"))})
-    elif command == "action.devices.commands.Dock":
-        traits.setdefault("sdm.devices.traits.Dock", {})["lastDockTs"] = time.time()
+    handler = _COMMAND_HANDLERS.get(command)
+    if handler is not None:
+        handler(traits, params)
+    app_state.home_devices_version = getattr(app_state, "home_devices_version", 0) + 1
     return {"ok": True, "device": device_id, "command": command}
 
 
 @router.get("/api/home/status")
-async def home_status(request: Request) -> JSONResponse:
+async def home_status(request: Request) -> Response:
     """Return Google Home auth state."""
-    adapter: Optional[RestAdapter] = request.app.state.rest_adapter
-    if adapter and hasattr(adapter, "get_home_status"):
+    app_state = request.app.state
+    get_status = _adapter_methods(app_state)["get_home_status"]
+    if get_status is not None:
+        cached = _cached_response(app_state, "status")
+        if cached is not None:
+            return cached
         try:
-            data = await adapter.get_home_status()
+            settings: Settings = app_state.settings
+            generation = getattr(app_state, "home_cache_generation", 0)
+            data = await _fetch_once(
+                app_state,
+                "status",
+                lambda: asyncio.wait_for(get_status(), timeout=settings.home_status_timeout_seconds),
+            )
             if isinstance(data, dict):
-                request.app.state.home_state = data
-                return JSONResponse(content=data)
+                app_state.home_state = data
+                ttl = settings.home_status_cache_ttl_seconds
+                return _cache_response(app_state, "status", data, ttl, generation)
         except Exception:  # pragma: no cover - network fallback
             pass
-    return JSONResponse(content=_home_state(request.app))
+    state = getattr(app_state, "home_state", None)
+    if not isinstance(state, dict):
+        return Response(content=_DEFAULT_HOME_STATE_JSON, media_type="application/json", headers=POLL_CACHE_HEADERS)
+    return ORJSONResponse(content=state, headers=POLL_CACHE_HEADERS)
 
 
 @router.get("/api/home/devices")
-async def home_devices(request: Request) -> JSONResponse:
+async def home_devices(request: Request) -> Response:
     """Return list of Google Home devices."""
-    adapter: Optional[RestAdapter] = request.app.state.rest_adapter
-    if adapter and hasattr(adapter, "get_home_devices"):
+    app_state = request.app.state
+    get_devices = _adapter_methods(app_state)["get_home_devices"]
+    if get_devices is not None:
+        cached = _cached_response(app_state, "devices")
+        if cached is not None:
+            return cached
         try:
-            result = await adapter.get_home_devices()
+            settings: Settings = app_state.settings
+            generation = getattr(app_state, "home_cache_generation", 0)
+            result = await _fetch_once(
+                app_state,
+                "devices",
+                lambda: asyncio.wait_for(get_devices(), timeout=settings.home_devices_timeout_seconds),
+            )
             if isinstance(result, dict) and not result.get("error"):
-                request.app.state.home_devices = result.get("devices", [])
-                return JSONResponse(content=result)
+                app_state.home_devices = result.get("devices", [])
+                ttl = settings.home_devices_cache_ttl_seconds
+                return _cache_response(app_state, "devices", result, ttl, generation)
         except Exception:  # pragma: no cover
             pass
-    return JSONResponse(content=_home_devices(request.app))
+    devices = getattr(app_state, "home_devices", None)
+    body = _local_devices_body(app_state, devices) if isinstance(devices, list) else _DEFAULT_DEVICES_JSON
+    return Response(content=body, media_type="application/json", headers=POLL_CACHE_HEADERS)
 
 
 @router.post("/api/home/command")
-async def home_command(request: Request, payload: Dict[str, Any]) -> JSONResponse:
+async def home_command(request: Request, body: HomeCommandRequest) -> ORJSONResponse:
     """Forward device command."""
-    adapter: Optional[RestAdapter] = request.app.state.rest_adapter
-    body = payload or {}
-    if adapter and hasattr(adapter, "post_home_command"):
+    app_state = request.app.state
+    post_command = _adapter_methods(app_state)["post_home_command"]
+    _invalidate_reads(app_state)
+    if post_command is not None:
         try:
-            result = await adapter.post_home_command(body)
+            settings: Settings = app_state.settings
+            result = await asyncio.wait_for(
+                post_command(body.model_dump(exclude_unset=True)), timeout=settings.home_command_timeout_seconds
+            )
             status = 200 if not result.get("error") else 502
-            return JSONResponse(content=result, status_code=status)
+            return ORJSONResponse(content=result, status_code=status)
+        except asyncio.TimeoutError:
+            return ORJSONResponse(content={"ok": False, "error": "upstream_timeout"}, status_code=504)
         except Exception as exc:  # pragma: no cover
-            return JSONResponse(content={"ok": False, "error": str(exc)}, status_code=502)
-    result = _apply_local_command(request.app, body)
-    return JSONResponse(content=result, status_code=200 if result.get("ok") else 400)
+            return ORJSONResponse(content={"ok": False, "error": str(exc)}, status_code=502)
+        finally:
+            # Reads that started while the write was in flight may have cached pre-write state
+            _invalidate_reads(app_state)
+    result = _apply_local_command(app_state, body)
+    return ORJSONResponse(content=result, status_code=200 if result.get("ok") else 400)
 
 
 @router.post("/api/home/auth")
-async def home_auth(request: Request) -> JSONResponse:
+async def home_auth(request: Request) -> Response:
     """Simulate Google auth handshake."""
-    adapter: Optional[RestAdapter] = request.app.state.rest_adapter
-    if adapter and hasattr(adapter, "post_home_auth"):
+    app_state = request.app.state
+    post_auth = _adapter_methods(app_state)["post_home_auth"]
+    _invalidate_reads(app_state)
+    if post_auth is not None:
         try:
-            result = await adapter.post_home_auth()
+            settings: Settings = app_state.settings
+            result = await asyncio.wait_for(post_auth(), timeout=settings.home_auth_timeout_seconds)
             status = 200 if not result.get("error") else 502
-            return JSONResponse(content=result, status_code=status)
+            return ORJSONResponse(content=result, status_code=status)
+        except asyncio.TimeoutError:
+            return ORJSONResponse(content={"ok": False, "error": "upstream_timeout"}, status_code=504)
         except Exception as exc:  # pragma: no cover
-            return JSONResponse(content={"ok": False, "error": str(exc)}, status_code=502)
-    state = _home_state(request.app)
+            return ORJSONResponse(content={"ok": False, "error": str(exc)}, status_code=502)
+        finally:
+            # Reads that started while the write was in flight may have cached pre-write state
+            _invalidate_reads(app_state)
+    state = _home_state(app_state)
     state["authenticated"] = True
     state.setdefault("profile", {})["updated_at"] = time.time()
-    return JSONResponse(content={"ok": True, "note": "local mock auth"})
+    return Response(content=_LOCAL_AUTH_OK_BODY, media_type="application/json")
@@ -1,27 +1,45 @@
 """Knowledge base API endpoints for RAG functionality."""
 
+import asyncio
+import functools
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, BackgroundTasks
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Request, Response
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import State
 
+from pc_client.api.response_utils import POLL_CACHE_HEADERS
 from pc_client.config.settings import settings
-from pc_client.core.knowledge.ingest import DocumentLoader, TextSplitter
+from pc_client.core.knowledge.ingest import Document, DocumentLoader, TextSplitter
 from pc_client.core.knowledge.store import VectorStore
 from pc_client.utils.async_helpers import run_sync
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Maximum query length for search requests
 MAX_QUERY_LENGTH = 1000
 
+# Pre-serialized bodies for the common request rejections
+_ERR_RAG_DISABLED = orjson.dumps({"ok": False, "error": "RAG is not enabled. Set RAG_ENABLED=true."})
+_ERR_EMPTY_QUERY = orjson.dumps({"ok": False, "error": "Query parameter 'q' is required"})
+_ERR_QUERY_TOO_LONG = orjson.dumps({"ok": False, "error": f"Query too long (max {MAX_QUERY_LENGTH} characters)"})
+
+# Maximum number of queued searches sent to the vector store in one batch
+MAX_SEARCH_BATCH = 16
+# Maximum number of vector store lookups (single or batched) running at once
+MAX_CONCURRENT_SEARCHES = 4
+
+# Pending search as (query, k, future)
+_PendingSearch = Tuple[str, int, "asyncio.Future[List[Document]]"]
+
 # Global vector store instance (lazy initialization)
 _vector_store: Optional[VectorStore] = None
-_reindex_in_progress = False
-_reindex_lock: Optional[Any] = None
+# In-flight reindex shared by concurrent callers (None when idle)
+_reindex_future: Optional["asyncio.Future[Dict[str, Any]]"] = None
 
 
 def _get_vector_store() -> VectorStore:
@@ -35,28 +53,21 @@ def _get_vector_store() -> VectorStore:
     return _vector_store
 
 
-async def _perform_reindex() -> Dict[str, Any]:
-    """Perform the reindexing operation.
+@functools.lru_cache(maxsize=4)
+def _parse_docs_paths(raw: str) -> Tuple[str, ...]:
+    """Split the comma-separated RAG_DOCS_PATHS value (cached per raw string)."""
+    return tuple(p.strip() for p in raw.split(",") if p.strip())
+
+
+async def _run_reindex() -> Dict[str, Any]:
+    """Load, split and index the documentation files.
 
     Returns:
         Dictionary with indexing results.
     """
-    global _reindex_in_progress
-
-    global _reindex_lock
-    if _reindex_lock is None:
-        import asyncio
-
-        _reindex_lock = asyncio.Lock()
-
-    async with _reindex_lock:
-        if _reindex_in_progress:
-            return {"ok": False, "error": "Reindexing already in progress"}
-        _reindex_in_progress = True
-
     try:
         # Parse document paths from settings
-        docs_paths = [p.strip() for p in settings.rag_docs_paths.split(",") if p.strip()]
+        docs_paths = list(_parse_docs_paths(settings.rag_docs_paths))
 
         # Load documents
         loader = DocumentLoader(paths=docs_paths)
@@ -99,8 +110,30 @@ async def _perform_reindex() -> Dict[str, Any]:
         logger.exception("Reindexing failed")
         return {"ok": False, "error": str(e)}
 
-    finally:
-        _reindex_in_progress = False
+
+def _clear_reindex_future(future: "asyncio.Future[Dict[str, Any]]") -> None:
+    global _reindex_future
+    if _reindex_future is future:
+        _reindex_future = None
+
+
+async def _perform_reindex() -> Dict[str, Any]:
+    """Perform the reindexing operation.
+
+    Concurrent callers share a single run: whoever arrives while a reindex is
+    in flight awaits the same result instead of starting (or being refused) a
+    second one.
+
+    Returns:
+        Dictionary with indexing results.
+    """
+    global _reindex_future
+    future = _reindex_future
+    if future is None:
+        future = asyncio.ensure_future(_run_reindex())
+        _reindex_future = future
+        future.add_done_callback(_clear_reindex_future)
+    return await asyncio.shield(future)
 
 
 async def _reindex_background_task():
@@ -109,13 +142,81 @@ async def _reindex_background_task():
     logger.info("Background reindex completed: %s", result)
 
 
+def _search_queue(app_state: State) -> List[_PendingSearch]:
+    """Searches waiting for a vector store lookup (kept on app.state, like its futures' loop)."""
+    queue = getattr(app_state, "knowledge_search_queue", None)
+    if queue is None:
+        queue = app_state.knowledge_search_queue = []
+    return queue
+
+
+def _search_workers(app_state: State) -> "set[asyncio.Task[None]]":
+    """Tasks currently draining the search queue."""
+    workers = getattr(app_state, "knowledge_search_workers", None)
+    if workers is None:
+        workers = app_state.knowledge_search_workers = set()
+    return workers
+
+
+async def _drain_search_queue(queue: List[_PendingSearch], workers: "set[asyncio.Task[None]]") -> None:
+    """Run queued searches one batch at a time until the queue is empty."""
+    try:
+        while queue:
+            batch = queue[:MAX_SEARCH_BATCH]
+            del queue[:MAX_SEARCH_BATCH]
+            store = _get_vector_store()
+            try:
+                if len(batch) == 1:
+                    query, k, _ = batch[0]
+                    results = [await run_sync(store.search, query, k)]
+                else:
+                    queries = [query for query, _, _ in batch]
+                    ks = [k for _, k, _ in batch]
+                    results = await run_sync(store.search_batch, queries, ks)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, _, future), documents in zip(batch, results):
+                if not future.done():
+                    future.set_result(documents)
+    finally:
+        # Leave the worker set in the same step that saw the queue empty, so a search
+        # queued right after is never left waiting for a worker that already stopped
+        current = asyncio.current_task()
+        if current is not None:
+            workers.discard(current)
+
+
+async def _search(app_state: State, query: str, k: int) -> List[Document]:
+    """Search the vector store, batching queries that arrive while lookups are running.
+
+    Up to MAX_CONCURRENT_SEARCHES lookups run in parallel, so one slow query
+    does not hold up the rest; queries that arrive while all of them are busy
+    are answered together by the next ``search_batch`` call.
+    """
+    future: "asyncio.Future[List[Document]]" = asyncio.get_running_loop().create_future()
+    queue = _search_queue(app_state)
+    queue.append((query, k, future))
+    workers = _search_workers(app_state)
+    if len(workers) < MAX_CONCURRENT_SEARCHES:
+        worker = asyncio.ensure_future(_drain_search_queue(queue, workers))
+        workers.add(worker)
+        worker.add_done_callback(workers.discard)
+    return await future
+
+
 @router.post("/api/knowledge/reindex")
 async def reindex_knowledge_base(
     background_tasks: BackgroundTasks,
     blocking: bool = False,
-) -> JSONResponse:
+) -> Response:
     """Reindex the knowledge base from documentation files.
 
+    A request arriving while a reindex is already running joins it rather
+    than failing.
+
     Args:
         background_tasks: FastAPI background tasks handler.
         blocking: If True, wait for indexing to complete. Default is False (async).
@@ -124,42 +225,42 @@ async def reindex_knowledge_base(
         JSON response with indexing status.
     """
     if not settings.rag_enabled:
-        return JSONResponse(
-            {"ok": False, "error": "RAG is not enabled. Set RAG_ENABLED=true."},
-            status_code=400,
-        )
-
-    global _reindex_in_progress
-    if _reindex_in_progress:
-        return JSONResponse(
-            {"ok": False, "error": "Reindexing already in progress"},
-            status_code=409,
-        )
+        return Response(content=_ERR_RAG_DISABLED, status_code=400, media_type="application/json")
 
     if blocking:
-        # Synchronous reindexing
+        # Synchronous reindexing (joins a run that is already in flight)
         result = await _perform_reindex()
         status_code = 200 if result.get("ok") else 500
-        return JSONResponse(result, status_code=status_code)
-    else:
-        # Async reindexing in background
-        background_tasks.add_task(_reindex_background_task)
-        return JSONResponse(
+        return ORJSONResponse(result, status_code=status_code)
+
+    if _reindex_future is not None:
+        return ORJSONResponse(
             {
                 "ok": True,
-                "message": "Reindexing started in background",
+                "message": "Reindexing already in progress",
             }
         )
 
+    # Async reindexing in background
+    background_tasks.add_task(_reindex_background_task)
+    return ORJSONResponse(
+        {
+            "ok": True,
+            "message": "Reindexing started in background",
+        }
+    )
+
 
 @router.get("/api/knowledge/search")
 async def search_knowledge_base(
+    request: Request,
     q: str,
     k: int = 3,
-) -> JSONResponse:
+) -> Response:
     """Search the knowledge base.
 
     Args:
+        request: Incoming request (its app state holds the search queue).
         q: Search query.
         k: Number of results to return (default: 3).
 
@@ -167,31 +268,22 @@ async def search_knowledge_base(
         JSON response with search results.
     """
     if not settings.rag_enabled:
-        return JSONResponse(
-            {"ok": False, "error": "RAG is not enabled. Set RAG_ENABLED=true."},
-            status_code=400,
-        )
+        return Response(content=_ERR_RAG_DISABLED, status_code=400, media_type="application/json")
 
-    if not q.strip():
-        return JSONResponse(
-            {"ok": False, "error": "Query parameter 'q' is required"},
-            status_code=400,
-        )
+    # isspace() checks blank queries without allocating a stripped copy
+    if not q or q.isspace():
+        return Response(content=_ERR_EMPTY_QUERY, status_code=400, media_type="application/json")
 
     if len(q) > MAX_QUERY_LENGTH:
-        return JSONResponse(
-            {"ok": False, "error": f"Query too long (max {MAX_QUERY_LENGTH} characters)"},
-            status_code=400,
-        )
+        return Response(content=_ERR_QUERY_TOO_LONG, status_code=400, media_type="application/json")
 
     # Limit k to reasonable bounds
     k = max(1, min(k, 10))
 
     try:
-        store = _get_vector_store()
-        results = await run_sync(store.search, q, k)
+        results = await _search(request.app.state, q, k)
 
-        return JSONResponse(
+        return ORJSONResponse(
             {
                 "ok": True,
                 "query": q,
@@ -209,33 +301,36 @@ async def search_knowledge_base(
 
     except Exception as e:
         logger.exception("Search failed")
-        return JSONResponse(
+        return ORJSONResponse(
             {"ok": False, "error": str(e)},
             status_code=500,
         )
 
 
 @router.get("/api/knowledge/status")
-async def knowledge_base_status() -> JSONResponse:
+async def knowledge_base_status() -> ORJSONResponse:
     """Get the status of the knowledge base.
 
     Returns:
         JSON response with knowledge base status.
     """
     if not settings.rag_enabled:
-        return JSONResponse(
+        return ORJSONResponse(
             {
                 "ok": True,
                 "enabled": False,
                 "message": "RAG is not enabled",
-            }
+            },
+            headers=POLL_CACHE_HEADERS,
         )
 
     try:
         store = _get_vector_store()
-        count = await run_sync(store.count)
+        count = store.cached_count
+        if count is None:
+            count = await run_sync(store.count)
 
-        return JSONResponse(
+        return ORJSONResponse(
             {
                 "ok": True,
                 "enabled": True,
@@ -243,13 +338,14 @@ async def knowledge_base_status() -> JSONResponse:
                 "document_count": count,
                 "embedding_model": settings.embedding_model,
                 "persist_path": settings.rag_persist_path,
-                "reindex_in_progress": _reindex_in_progress,
-            }
+                "reindex_in_progress": _reindex_future is not None,
+            },
+            headers=POLL_CACHE_HEADERS,
         )
 
     except Exception as e:
         logger.exception("Status check failed")
-        return JSONResponse(
+        return ORJSONResponse(
             {"ok": False, "error": str(e)},
             status_code=500,
         )
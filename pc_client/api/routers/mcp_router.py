@@ -6,16 +6,24 @@ Endpointy MCP dla Rider-PC:
 - POST /api/mcp/tools/invoke - wywołanie narzędzia
 """
 
+import atexit
+import hashlib
 import logging
+import logging.handlers
+import mmap
 import os
-from typing import Any, Dict, List, Optional
+import queue
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
+from pc_client.api.response_utils import POLL_CACHE_HEADERS
+
 # Import registry - tools are registered on import
-from pc_client.mcp.registry import registry
+from pc_client.mcp.registry import ToolErrorCode, registry
 from pc_client.mcp import tools as _  # noqa: F401 - triggers tool registration
 
 logger = logging.getLogger(__name__)
@@ -24,27 +32,60 @@ logger = logging.getLogger(__name__)
 mcp_file_logger = logging.getLogger("mcp.tools")
 
 
+# Wątek zapisujący mcp-tools.log w tle (None dopóki logger nie jest skonfigurowany)
+_mcp_log_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _mcp_log_path() -> str:
+    """Ścieżka logu wywołań narzędzi względem bieżącego katalogu roboczego."""
+    return os.path.join(os.getcwd(), "logs", "mcp-tools.log")
+
+
 def _setup_mcp_file_logger():
-    """Skonfiguruj dedykowany logger dla pliku mcp-tools.log."""
-    if mcp_file_logger.handlers:
+    """Skonfiguruj dedykowany logger dla pliku mcp-tools.log.
+
+    Rekordy trafiają do kolejki, a zapis na dysk wykonuje QueueListener
+    w osobnym wątku, więc wywołanie narzędzia nie czeka na write().
+    Wywoływana leniwie przy pierwszym wywołaniu narzędzia; uruchomiony
+    listener oznacza, że konfiguracja już się odbyła (handlery dodane
+    przez innych nie blokują konfiguracji).
+    """
+    global _mcp_log_listener
+    if _mcp_log_listener is not None:
         return
 
-    logs_dir = os.path.join(os.getcwd(), "logs")
-    os.makedirs(logs_dir, exist_ok=True)
+    log_path = _mcp_log_path()
+    os.makedirs(os.path.dirname(log_path), exist_ok=True)
 
     file_handler = logging.FileHandler(
-        os.path.join(logs_dir, "mcp-tools.log"),
+        log_path,
         encoding="utf-8",
+        delay=True,
     )
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
-    mcp_file_logger.addHandler(file_handler)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _mcp_log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+    _mcp_log_listener.start()
+    # Dopisz zaległe rekordy przy zamykaniu procesu
+    atexit.register(_mcp_log_listener.stop)
+
+    mcp_file_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     mcp_file_logger.setLevel(logging.INFO)
 
 
-_setup_mcp_file_logger()
+router = APIRouter(prefix="/api/mcp", tags=["mcp"], default_response_class=ORJSONResponse)
+
+# Status HTTP dla nieudanego wywołania wg rodzaju błędu
+_ERROR_STATUS = {
+    ToolErrorCode.NONE: 400,
+    ToolErrorCode.NOT_FOUND: 404,
+    ToolErrorCode.INVALID: 400,
+}
 
-router = APIRouter(prefix="/api/mcp", tags=["mcp"])
+# Zserializowana lista narzędzi: (wersja rejestru, treść JSON, ETag)
+_tools_cache: Optional[Tuple[int, bytes, str]] = None
 
 
 class InvokeToolRequest(BaseModel):
@@ -55,8 +96,28 @@ class InvokeToolRequest(BaseModel):
     confirm: bool = Field(default=False, description="Potwierdzenie dla operacji wymagających zgody")
 
 
+def _tools_body() -> Tuple[bytes, str]:
+    """Zwróć treść i ETag listy narzędzi, serializując ją ponownie tylko po zmianie rejestru."""
+    global _tools_cache
+    version = registry.version
+    if _tools_cache is None or _tools_cache[0] != version:
+        tool_list: List[Dict[str, Any]] = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "args_schema": tool.args_schema,
+                "permissions": tool.permissions,
+            }
+            for tool in registry.list_tools()
+        ]
+        body = orjson.dumps({"ok": True, "tools": tool_list, "count": len(tool_list)})
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        _tools_cache = (version, body, etag)
+    return _tools_cache[1], _tools_cache[2]
+
+
 @router.get("/tools")
-async def list_tools() -> JSONResponse:
+async def list_tools(request: Request) -> Response:
     """Lista dostępnych narzędzi MCP.
 
     Returns:
@@ -76,29 +137,15 @@ async def list_tools() -> JSONResponse:
         "count": 4
     }
     """
-    tool_list: List[Dict[str, Any]] = []
-
-    for tool in registry.list_tools():
-        tool_list.append(
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "args_schema": tool.args_schema,
-                "permissions": tool.permissions,
-            }
-        )
-
-    return JSONResponse(
-        {
-            "ok": True,
-            "tools": tool_list,
-            "count": len(tool_list),
-        }
-    )
+    body, etag = _tools_body()
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/resources")
-async def get_resources(request: Request) -> JSONResponse:
+async def get_resources(request: Request) -> ORJSONResponse:
     """Pobierz zasoby MCP (konfiguracja, status).
 
     Returns:
@@ -124,19 +171,20 @@ async def get_resources(request: Request) -> JSONResponse:
 
     stats = registry.get_stats()
 
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "ok": True,
             "resources": {
                 "config": config,
                 "stats": stats,
             },
-        }
+        },
+        headers=POLL_CACHE_HEADERS,
     )
 
 
 @router.post("/tools/invoke")
-async def invoke_tool(payload: InvokeToolRequest) -> JSONResponse:
+async def invoke_tool(payload: InvokeToolRequest) -> ORJSONResponse:
     """Wywołaj narzędzie MCP.
 
     Args:
@@ -162,6 +210,7 @@ async def invoke_tool(payload: InvokeToolRequest) -> JSONResponse:
     result = await registry.invoke(payload.tool, payload.arguments, confirm=payload.confirm)
 
     # Log do mcp-tools.log (dedykowany plik)
+    _setup_mcp_file_logger()
     if result.ok:
         log_entry = f"INVOKE {payload.tool} -> SUCCESS ({result.meta.get('duration_ms', 0)}ms)"
         mcp_file_logger.info(log_entry)
@@ -171,35 +220,34 @@ async def invoke_tool(payload: InvokeToolRequest) -> JSONResponse:
         mcp_file_logger.warning(log_entry)
         logger.warning("[MCP] %s -> error: %s", payload.tool, result.error)
 
-    status_code = 200 if result.ok else (404 if "not found" in (result.error or "") else 400)
+    status_code = 200 if result.ok else _ERROR_STATUS[result.error_code]
 
-    return JSONResponse(result.to_dict(), status_code=status_code)
+    return ORJSONResponse(result.to_dict(), status_code=status_code)
 
 
 @router.get("/stats")
-async def get_stats() -> JSONResponse:
+async def get_stats() -> ORJSONResponse:
     """Pobierz statystyki użycia MCP.
 
     Returns:
         JSON ze statystykami wywołań narzędzi.
     """
     stats = registry.get_stats()
-    return JSONResponse(
+    return ORJSONResponse(
         {
             "ok": True,
             "stats": stats,
-        }
+        },
+        headers=POLL_CACHE_HEADERS,
     )
 
 
-# Próg rozmiaru pliku dla użycia zoptymalizowanego odczytu (64KB)
-_LARGE_FILE_THRESHOLD = 65536
-
-
 def _read_last_lines(file_path: str, num_lines: int, max_line_length: int = 1024) -> list:
     """Efektywne czytanie ostatnich N linii z pliku.
 
-    Czyta plik od końca, unikając wczytywania całego pliku do pamięci.
+    Mapuje plik w pamięci (mmap) i cofa się od końca kolejnymi ``rfind(b"\\n")``,
+    więc koszt zależy od liczby zwracanych linii, a nie od rozmiaru pliku,
+    i nic nie jest doklejane do rosnącego bufora.
 
     Args:
         file_path: Ścieżka do pliku.
@@ -209,83 +257,39 @@ def _read_last_lines(file_path: str, num_lines: int, max_line_length: int = 1024
     Returns:
         Lista ostatnich N linii (od najstarszej do najnowszej).
     """
-    import os
-
     lines: list[str] = []
-    file_size = os.path.getsize(file_path)
-
-    if file_size == 0:
+    # mmap nie obsługuje pustych plików
+    if num_lines <= 0 or os.path.getsize(file_path) == 0:
         return lines
 
-    # Początkowy rozmiar bufora - dostosowany do oczekiwanej liczby linii
-    buffer_size = min(max(4096, num_lines * 200), file_size)
-
-    with open(file_path, "rb") as f:
-        # Zacznij od końca pliku
-        position = file_size
-        buffer = b""
-
-        while position > 0 and len(lines) < num_lines:
-            # Cofnij się o rozmiar bufora
-            read_size = min(buffer_size, position)
-            position -= read_size
-            f.seek(position)
-
-            # Czytaj fragment i dodaj do bufora
-            chunk = f.read(read_size)
-            buffer = chunk + buffer
-
-            # Rozdziel na linie
-            split_lines = buffer.split(b"\n")
-
-            # Logika obsługi niepełnych linii:
-            # - Jeśli nie jesteśmy na początku pliku, pierwsza linia może być niepełna
-            # - Zachowaj ją do następnej iteracji
-            if position > 0:
-                buffer = split_lines[0]
-                process_lines = split_lines[1:]
-            else:
-                # Jesteśmy na początku - wszystkie linie są kompletne
-                buffer = b""
-                process_lines = split_lines
-
-            # Przetwórz linie (od końca do początku)
-            for raw_line in reversed(process_lines):
-                if len(lines) >= num_lines:
-                    break
-                try:
-                    line = raw_line.decode("utf-8", errors="replace").strip()
-                    if line:
-                        # Ogranicz długość linii
-                        if len(line) > max_line_length:
-                            line = line[:max_line_length] + "..."
-                        lines.append(line)
-                # Ignorujemy wyjątki dekodowania, bo linia może być niekompletna lub uszkodzona
-                except Exception as exc:
-                    logger.debug("Błąd dekodowania linii z pliku %s: %s", file_path, exc)
-
-        # Przetwórz pozostały bufor jeśli potrzeba więcej linii
-        if len(lines) < num_lines and buffer:
-            try:
-                line = buffer.decode("utf-8", errors="replace").strip()
-                if line:
-                    if len(line) > max_line_length:
-                        line = line[:max_line_length] + "..."
-                    lines.append(line)
-            # Ignorujemy wyjątki dekodowania dla pozostałego bufora
-            except Exception as exc:
-                logger.debug("Błąd dekodowania pozostałego bufora z pliku %s: %s", file_path, exc)
-
-    # Odwróć aby zachować chronologiczną kolejność (od najstarszej do najnowszej)
-    return list(reversed(lines))
+    raw_lines: list[bytes] = []
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        end = len(mm)
+        while end > 0 and len(raw_lines) < num_lines:
+            start = mm.rfind(b"\n", 0, end) + 1
+            raw_line = mm[start:end].strip()
+            if raw_line:
+                raw_lines.append(raw_line)
+            end = start - 1
+
+    # Odwróć aby zachować chronologiczną kolejność i zdekoduj wszystko jednym wywołaniem
+    raw_lines.reverse()
+    text = b"\n".join(raw_lines).decode("utf-8", errors="replace")
+    for line in text.split("\n"):
+        line = line.strip()
+        if line:
+            # Ogranicz długość linii
+            if len(line) > max_line_length:
+                line = line[:max_line_length] + "..."
+            lines.append(line)
+    return lines
 
 
 @router.get("/history")
-async def get_invocation_history(limit: int = 50) -> JSONResponse:
+async def get_invocation_history(limit: int = 50) -> ORJSONResponse:
     """Pobierz historię wywołań narzędzi MCP z logu.
 
-    Używa efektywnego czytania od końca pliku, unikając wczytywania
-    całego pliku do pamięci dla dużych logów.
+    Czyta tylko koniec pliku (mmap od końca), niezależnie od rozmiaru logu.
 
     Args:
         limit: Maksymalna liczba wpisów do zwrócenia (1-200).
@@ -293,30 +297,19 @@ async def get_invocation_history(limit: int = 50) -> JSONResponse:
     Returns:
         JSON z historią wywołań.
     """
-    import os
-
     limit = min(max(1, limit), 200)
     history = []
 
-    log_path = os.path.join(os.getcwd(), "logs", "mcp-tools.log")
-    if os.path.exists(log_path):
-        try:
-            file_size = os.path.getsize(log_path)
-            # Dla małych plików używamy prostego odczytu
-            if file_size < _LARGE_FILE_THRESHOLD:
-                with open(log_path, "r", encoding="utf-8") as f:
-                    lines = f.readlines()
-                    for line in lines[-limit:]:
-                        line = line.strip()
-                        if line:
-                            history.append(line)
-            else:
-                # Dla dużych plików używamy efektywnego czytania od końca
-                history = _read_last_lines(log_path, limit)
-        except Exception as e:
-            logger.warning("Failed to read mcp-tools.log: %s", e)
-
-    return JSONResponse(
+    log_path = _mcp_log_path()
+    try:
+        history = _read_last_lines(log_path, limit)
+    except FileNotFoundError:
+        # Brak logu = brak wywołań; bez osobnego os.path.exists()
+        pass
+    except Exception as e:
+        logger.warning("Failed to read mcp-tools.log: %s", e)
+
+    return ORJSONResponse(
         {
             "ok": True,
             "history": history,
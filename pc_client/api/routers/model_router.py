@@ -1,13 +1,19 @@
 """Model management API endpoints."""
 
+import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field, field_validator
+from starlette.datastructures import State
 
 from pc_client.core.model_manager import ModelManager
+from pc_client.utils.async_helpers import run_sync
 
 
 class BindModelRequest(BaseModel):
@@ -28,34 +34,102 @@ class BindModelRequest(BaseModel):
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/models", tags=["models"])
+# Slots a model can be bound to, and the pre-serialized rejection for any other value
+_VALID_SLOTS = frozenset({"vision", "voice_asr", "voice_tts", "text"})
+_ERR_INVALID_SLOT = orjson.dumps({"error": f"Invalid slot. Must be one of: {sorted(_VALID_SLOTS)}"})
+
+router = APIRouter(prefix="/api/models", tags=["models"], default_response_class=ORJSONResponse)
+
+# How long a fetched Rider-PI model inventory is reused
+REMOTE_MODELS_TTL_SECONDS = 5.0
 
 
 def get_model_manager(request: Request) -> ModelManager:
     """Get or create ModelManager instance from app state."""
-    if not hasattr(request.app.state, "model_manager") or request.app.state.model_manager is None:
-        request.app.state.model_manager = ModelManager()
-    return request.app.state.model_manager
+    manager: Optional[ModelManager] = getattr(request.app.state, "model_manager", None)
+    if manager is None:
+        manager = ModelManager()
+        request.app.state.model_manager = manager
+    return manager
 
 
-async def _fetch_remote_models(request: Request) -> List[Dict[str, Any]]:
-    """Fetch Rider-PI model inventory via RestAdapter."""
-    adapter = getattr(request.app.state, "rest_adapter", None)
-    if adapter is None:
-        return []
-
+async def _load_remote_models(app_state: State, adapter: Any) -> List[Dict[str, Any]]:
+    """Fetch the Rider-PI model inventory and remember it for REMOTE_MODELS_TTL_SECONDS."""
     try:
         remote_payload = await adapter.get_remote_models()
     except Exception as exc:  # pragma: no cover - network errors
         logger.debug("Failed to fetch Rider-PI models: %s", exc)
         return []
 
-    if not isinstance(remote_payload, dict):
+    models: Any = None
+    if isinstance(remote_payload, dict):
+        # Try "models" key first, fall back to "local" for backward compatibility
+        models = remote_payload.get("models", remote_payload.get("local"))
+    result = models if isinstance(models, list) else []
+    # Last remote inventory as (adapter, expires_at, models)
+    app_state.remote_models_cache = (adapter, time.monotonic() + REMOTE_MODELS_TTL_SECONDS, result)
+    return result
+
+
+def _clear_remote_inflight(app_state: State, task: "asyncio.Future[List[Dict[str, Any]]]") -> None:
+    inflight = getattr(app_state, "remote_models_inflight", None)
+    if inflight is not None and inflight[1] is task:
+        app_state.remote_models_inflight = None
+
+
+async def _fetch_remote_models(request: Request) -> List[Dict[str, Any]]:
+    """Fetch Rider-PI model inventory via RestAdapter.
+
+    Results are reused for a few seconds and concurrent callers share one
+    upstream request, so polling /installed and /summary together costs a
+    single round trip.
+    """
+    app_state = request.app.state
+    adapter = getattr(app_state, "rest_adapter", None)
+    if adapter is None:
         return []
 
-    # Try "models" key first, fall back to "local" for backward compatibility
-    models = remote_payload.get("models", remote_payload.get("local"))
-    return models if isinstance(models, list) else []
+    cached: Optional[Tuple[Any, float, List[Dict[str, Any]]]] = getattr(app_state, "remote_models_cache", None)
+    if cached is not None and cached[0] is adapter and cached[1] > time.monotonic():
+        return cached[2]
+
+    # In-flight fetch as (adapter, task)
+    inflight: Optional[Tuple[Any, "asyncio.Future[List[Dict[str, Any]]]"]] = getattr(
+        app_state, "remote_models_inflight", None
+    )
+    if inflight is None or inflight[0] is not adapter:
+        task = asyncio.ensure_future(_load_remote_models(app_state, adapter))
+        inflight = app_state.remote_models_inflight = (adapter, task)
+        task.add_done_callback(functools.partial(_clear_remote_inflight, app_state))
+    return await asyncio.shield(inflight[1])
+
+
+async def _scan_ollama_quietly(manager: ModelManager, ollama_host: Optional[str] = None) -> None:
+    """Refresh the Ollama model list, ignoring an unreachable Ollama."""
+    try:
+        await manager.scan_ollama_models(ollama_host)
+    except Exception as e:
+        logger.debug("Could not scan Ollama models: %s", e)
+
+
+async def _refresh_inventories(request: Request, manager: ModelManager) -> List[Dict[str, Any]]:
+    """Rescan local and Ollama models and fetch the Rider-PI inventory concurrently.
+
+    The active configuration is loaded once here, on the event loop, and handed to
+    both scans: the local scan runs in a worker thread and must not reload (and
+    replace) the manager's shared configuration while the Ollama scan reads it.
+
+    Returns:
+        The Rider-PI model list.
+    """
+    active = manager.get_active_models()
+    ollama_host = active.text.get("ollama_host") if isinstance(active.text, dict) else None
+    _, _, remote = await asyncio.gather(
+        run_sync(manager.scan_local_models, manager.providers_config),
+        _scan_ollama_quietly(manager, ollama_host),
+        _fetch_remote_models(request),
+    )
+    return remote
 
 
 async def _switch_provider_mode(request: Request, slot: str, target: str) -> Optional[Dict[str, Any]]:
@@ -82,7 +156,7 @@ async def _switch_provider_mode(request: Request, slot: str, target: str) -> Opt
 
 
 @router.get("/installed")
-async def get_installed_models(request: Request) -> JSONResponse:
+async def get_installed_models(request: Request) -> ORJSONResponse:
     """
     List installed model files from the local models directory.
 
@@ -97,20 +171,12 @@ async def get_installed_models(request: Request) -> JSONResponse:
     manager = get_model_manager(request)
 
     try:
-        # Scan for local models
-        manager.scan_local_models()
-
-        # Try to get Ollama models
-        try:
-            await manager.scan_ollama_models()
-        except Exception as e:
-            logger.debug("Could not scan Ollama models: %s", e)
+        remote = await _refresh_inventories(request, manager)
 
         installed = manager.get_installed_models()
         ollama = manager.get_ollama_models()
-        remote = await _fetch_remote_models(request)
 
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "local": installed,
                 "ollama": ollama,
@@ -126,7 +192,7 @@ async def get_installed_models(request: Request) -> JSONResponse:
 
 
 @router.get("/active")
-async def get_active_models(request: Request) -> JSONResponse:
+async def get_active_models(request: Request) -> ORJSONResponse:
     """
     Get currently active model configuration.
 
@@ -140,14 +206,14 @@ async def get_active_models(request: Request) -> JSONResponse:
 
     try:
         active = manager.get_active_models()
-        return JSONResponse(content=active.to_dict())
+        return ORJSONResponse(content=active.to_dict())
     except Exception as e:
         logger.error("Failed to get active models: %s", e)
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
 @router.post("/bind")
-async def bind_model(request: Request, payload: BindModelRequest) -> JSONResponse:
+async def bind_model(request: Request, payload: BindModelRequest) -> Response:
     """
     Bind a model to a specific slot.
 
@@ -163,12 +229,8 @@ async def bind_model(request: Request, payload: BindModelRequest) -> JSONRespons
     provider = payload.provider
     model = payload.model
 
-    valid_slots = {"vision", "voice_asr", "voice_tts", "text"}
-    if slot not in valid_slots:
-        return JSONResponse(
-            status_code=400,
-            content={"error": f"Invalid slot. Must be one of: {sorted(valid_slots)}"},
-        )
+    if slot not in _VALID_SLOTS:
+        return Response(content=_ERR_INVALID_SLOT, status_code=400, media_type="application/json")
 
     manager = get_model_manager(request)
 
@@ -184,7 +246,7 @@ async def bind_model(request: Request, payload: BindModelRequest) -> JSONRespons
 
     logger.info("Model binding updated: slot=%s, provider=%s, model=%s", slot, provider, model)
 
-    return JSONResponse(
+    return ORJSONResponse(
         content={
             "success": True,
             "slot": slot,
@@ -196,7 +258,7 @@ async def bind_model(request: Request, payload: BindModelRequest) -> JSONRespons
 
 
 @router.get("/summary")
-async def get_models_summary(request: Request) -> JSONResponse:
+async def get_models_summary(request: Request) -> ORJSONResponse:
     """
     Get a summary of the model configuration and inventory.
 
@@ -208,19 +270,11 @@ async def get_models_summary(request: Request) -> JSONResponse:
     manager = get_model_manager(request)
 
     try:
-        # Refresh data
-        manager.scan_local_models()
-        try:
-            await manager.scan_ollama_models()
-        except Exception:
-            pass  # Ollama may not be available
-
-        manager.get_active_models()
-        remote = await _fetch_remote_models(request)
+        remote = await _refresh_inventories(request, manager)
         payload = manager.get_all_models()
         payload["remote"] = remote
 
-        return JSONResponse(content=payload)
+        return ORJSONResponse(content=payload)
     except Exception as e:
         logger.error("Failed to get models summary: %s", e)
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -3,7 +3,6 @@
 import asyncio
 import logging
 import os
-import re
 import time
 import unicodedata
 from typing import Any, Dict, List, Literal, Optional, Union
@@ -30,6 +29,17 @@ FORCE_GITHUB_MOCK_ENV = "GITHUB_FORCE_MOCK"
 FORCE_GITHUB_MOCK_CONFIGURED_ENV = "GITHUB_MOCK_CONFIGURED"
 
 
+# slugify: one bytes.translate pass lowercases ASCII letters, turns whitespace/underscores
+# into hyphens and deletes everything else outside [a-z0-9-]
+_SLUG_SEPARATORS = bytes(c for c in range(128) if chr(c).isspace() or chr(c) == "_")
+_SLUG_TABLE = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ" + _SLUG_SEPARATORS,
+    b"abcdefghijklmnopqrstuvwxyz" + b"-" * len(_SLUG_SEPARATORS),
+)
+_SLUG_KEEP = frozenset(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-" + _SLUG_SEPARATORS)
+_SLUG_DELETE = bytes(c for c in range(256) if c not in _SLUG_KEEP)
+
+
 def slugify(text: str, max_length: int = 50) -> str:
     """
     Convert text to URL/filesystem-safe slug.
@@ -41,20 +51,12 @@ def slugify(text: str, max_length: int = 50) -> str:
     Returns:
         Slugified string (lowercase, no spaces, ASCII only).
     """
-    # Normalize unicode characters
-    text = unicodedata.normalize('NFKD', text)
-    # Remove non-ASCII characters
-    text = text.encode('ascii', 'ignore').decode('ascii')
-    # Convert to lowercase
-    text = text.lower()
-    # Replace spaces and underscores with hyphens
-    text = re.sub(r'[\s_]+', '-', text)
-    # Remove any character that is not alphanumeric or hyphen
-    text = re.sub(r'[^a-z0-9-]', '', text)
-    # Remove multiple consecutive hyphens
-    text = re.sub(r'-+', '-', text)
-    # Strip leading/trailing hyphens
-    text = text.strip('-')
+    # Normalize unicode characters and drop what has no ASCII form
+    raw = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore')
+    # Lowercase, map spaces/underscores to hyphens, remove other characters
+    text = raw.translate(_SLUG_TABLE, _SLUG_DELETE).decode('ascii')
+    # Collapse runs of hyphens and strip leading/trailing ones
+    text = '-'.join(part for part in text.split('-') if part)
     # Truncate to max length
     if len(text) > max_length:
         text = text[:max_length].rstrip('-')
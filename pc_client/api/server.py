@@ -1,6 +1,5 @@
 """FastAPI server for replicating Rider-PI UI."""
 
-import asyncio
 import logging
 import time
 from pathlib import Path
@@ -78,6 +77,8 @@ def create_app(settings: Settings, cache: CacheManager) -> FastAPI:
         "navigator": {"active": False, "strategy": "standard", "state": "idle"},
         "camera": {"vision_enabled": True, "on": True, "res": [1280, 720]},
     }
+    app.state.control_state_version = 0
+    app.state.control_state_snapshot = None
     app.state.resources = cast(
         Dict[str, Dict[str, Any]],
         {
@@ -133,13 +134,15 @@ def create_app(settings: Settings, cache: CacheManager) -> FastAPI:
         ],
     )
     app.state.motion_queue = cast(List[Dict[str, Any]], [])
+    placeholder_frame = (
+        b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x02\x00\x00\x00\x02"
+        b"\x08\x06\x00\x00\x00\xf4x\xd4\xfa\x00\x00\x00\x19IDATx\x9cc```\xf8"
+        b"\x0f\x04\x0c\x0c\x0c\x0c\x00\x01\x04\x01\x00tC^\x8f\x00\x00\x00\x00IEND"
+        b"\xaeB`\x82"
+    )
     app.state.last_camera_frame = {
-        "content": (
-            b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x02\x00\x00\x00\x02"
-            b"\x08\x06\x00\x00\x00\xf4x\xd4\xfa\x00\x00\x00\x19IDATx\x9cc```\xf8"
-            b"\x0f\x04\x0c\x0c\x0c\x0c\x00\x01\x04\x01\x00tC^\x8f\x00\x00\x00\x00IEND"
-            b"\xaeB`\x82"
-        ),
+        "content": placeholder_frame,
+        "length": len(placeholder_frame),
         "timestamp": time.time(),
         "media_type": "image/png",
     }
@@ -148,12 +151,18 @@ def create_app(settings: Settings, cache: CacheManager) -> FastAPI:
     app.state.sync_task = None
     app.state.provider_heartbeat_task = None
     app.state.camera_sync_task = None
+    app.state.sse_heartbeat_task = None
     app.state.last_lcd_poweroff_ts = 0.0
     app.state.home_state = {
         "authenticated": True,
         "profile": {"email": "mock-user@rider.ai", "name": "Mock User"},
         "scopes": ["homegraph", "cloud-control"],
     }
+    app.state.home_response_cache = {}
+    app.state.home_inflight_reads = {}
+    app.state.home_cache_generation = 0
+    app.state.home_devices_version = 0
+    app.state.home_devices_body = None
     app.state.home_devices = [
         {
             "name": "devices/light/workbench",
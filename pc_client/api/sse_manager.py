@@ -3,18 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import time
 from collections import deque
-from typing import Deque, Dict, Iterable, Optional
+from typing import Deque, Dict, Iterable, Optional, Tuple
 
 
 class SseManager:
     """Centralized SSE subscription helper with backlog + retry support."""
 
-    def __init__(self, backlog_limit: int = 200, queue_size: int = 100) -> None:
+    def __init__(self, backlog_limit: int = 200, queue_size: int = 256) -> None:
         self._backlog: Deque[Dict] = deque(maxlen=backlog_limit)
         self._subscribers: set[asyncio.Queue] = set()
         self._queue_size = queue_size
+        self._pending: Optional[asyncio.Queue[Tuple[Dict, bool]]] = None
+        self._pending_retained = 0
+        self._fanout_task: Optional[asyncio.Task] = None
 
     @staticmethod
     def _stamp(payload: Dict) -> Dict:
@@ -22,23 +26,80 @@ class SseManager:
         payload.setdefault("ts", time.time())
         return payload
 
-    def publish(self, payload: Dict) -> None:
-        """Store payload and fan it out to all subscribers."""
-        stamped = self._stamp(payload)
-        self._backlog.append(stamped)
-        stale: list[asyncio.Queue] = []
-        for queue in list(self._subscribers):
+    @staticmethod
+    def _offer(queue: asyncio.Queue, event: Dict) -> None:
+        """Enqueue event, dropping the oldest pending one when the queue is full."""
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
             try:
-                queue.put_nowait(stamped)
-            except asyncio.QueueFull:
-                stale.append(queue)
-        for queue in stale:
-            self.unsubscribe(queue)
+                queue.get_nowait()
+            except asyncio.QueueEmpty:  # pragma: no cover - drained concurrently
+                pass
+            queue.put_nowait(event)
+
+    def _fan_out(self, event: Dict) -> None:
+        for queue in tuple(self._subscribers):
+            self._offer(queue, event)
+
+    def publish(self, payload: Dict, retain: bool = True) -> None:
+        """Store payload and fan it out to all subscribers.
+
+        Subscriber queues are bounded; a slow client loses its oldest pending
+        events instead of stalling the publisher or growing without limit.
+        Pass ``retain=False`` for transient frames (e.g. heartbeats) that should
+        not be replayed to new subscribers.
+
+        After :meth:`start`, the fan-out is handed to a background task so the
+        caller only pays for one enqueue regardless of the subscriber count.
+        """
+        stamped = self._stamp(payload)
+        if retain:
+            self._backlog.append(stamped)
+        if self._pending is not None:
+            self._pending.put_nowait((stamped, retain))
+            if retain:
+                self._pending_retained += 1
+            return
+        self._fan_out(stamped)
+
+    def start(self) -> None:
+        """Start the background fan-out task (requires a running event loop)."""
+        if self._fanout_task is not None and not self._fanout_task.done():
+            return
+        self._pending = asyncio.Queue()
+        self._fanout_task = asyncio.create_task(self._fanout_loop(self._pending))
+
+    async def stop(self) -> None:
+        """Stop the background fan-out task and deliver anything still pending."""
+        task, pending = self._fanout_task, self._pending
+        self._fanout_task = None
+        self._pending = None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        while pending is not None and not pending.empty():
+            event, _ = pending.get_nowait()
+            self._fan_out(event)
+        self._pending_retained = 0
+
+    async def _fanout_loop(self, pending: asyncio.Queue[Tuple[Dict, bool]]) -> None:
+        while True:
+            event, retain = await pending.get()
+            if retain:
+                self._pending_retained -= 1
+            self._fan_out(event)
 
     def subscribe(self) -> asyncio.Queue:
         """Register a new queue and preload backlog events."""
         queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
-        for event in list(self._backlog):
+        backlog = list(self._backlog)
+        if self._pending_retained:
+            # The newest backlog entries are still queued for fan-out and will
+            # reach this subscriber through the background task.
+            backlog = backlog[: -self._pending_retained]
+        for event in backlog:
             try:
                 queue.put_nowait(event)
             except asyncio.QueueFull:
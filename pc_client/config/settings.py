@@ -101,6 +101,24 @@ def _safe_int(env_var: str, default: str) -> int:
         return int(default)
 
 
+def _safe_float(env_var: str, default: str) -> float:
+    """Safely parse a float from an environment variable.
+
+    Args:
+        env_var: Name of the environment variable.
+        default: Default value as a string.
+
+    Returns:
+        Parsed float value, or default if parsing fails.
+    """
+    value = os.getenv(env_var, default)
+    try:
+        return float(value)
+    except ValueError:
+        _settings_logger.warning("Invalid value '%s' for %s, using default %s", value, env_var, default)
+        return float(default)
+
+
 def _parse_monitored_services() -> List[str]:
     """Parse MONITORED_SERVICES from environment variable.
 
@@ -258,6 +276,26 @@ class Settings:
     )
     google_assistant_device_id: Optional[str] = field(default_factory=lambda: os.getenv("GOOGLE_ASSISTANT_DEVICE_ID"))
     google_assistant_language: str = field(default_factory=lambda: os.getenv("GOOGLE_ASSISTANT_LANGUAGE", "pl-PL"))
+
+    # Google Home proxy timeouts (seconds) for calls forwarded to Rider-PI
+    home_status_timeout_seconds: float = field(
+        default_factory=lambda: _safe_float("HOME_STATUS_TIMEOUT_SECONDS", "1.0")
+    )
+    home_devices_timeout_seconds: float = field(
+        default_factory=lambda: _safe_float("HOME_DEVICES_TIMEOUT_SECONDS", "2.0")
+    )
+    home_command_timeout_seconds: float = field(
+        default_factory=lambda: _safe_float("HOME_COMMAND_TIMEOUT_SECONDS", "3.0")
+    )
+    home_auth_timeout_seconds: float = field(default_factory=lambda: _safe_float("HOME_AUTH_TIMEOUT_SECONDS", "3.0"))
+    # TTL (seconds) for cached Rider-PI Google Home reads; 0 disables caching
+    home_status_cache_ttl_seconds: float = field(
+        default_factory=lambda: _safe_float("HOME_STATUS_CACHE_TTL_SECONDS", "2.0")
+    )
+    home_devices_cache_ttl_seconds: float = field(
+        default_factory=lambda: _safe_float("HOME_DEVICES_CACHE_TTL_SECONDS", "5.0")
+    )
+
     # MCP (Model Context Protocol) configuration
     mcp_standalone: bool = field(default_factory=lambda: os.getenv("MCP_STANDALONE", "false").lower() == "true")
     mcp_port: int = field(default_factory=lambda: _safe_int("MCP_PORT", "8210"))
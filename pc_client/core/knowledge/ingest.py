@@ -6,12 +6,16 @@ for use in the RAG (Retrieval-Augmented Generation) system.
 
 import logging
 import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+
 
 @dataclass
 class Document:
@@ -29,15 +33,17 @@ class Document:
 class DocumentLoader:
     """Recursively loads Markdown files from a directory."""
 
-    def __init__(self, paths: List[str], base_dir: Optional[str] = None):
+    def __init__(self, paths: List[str], base_dir: Optional[str] = None, max_workers: int = 8):
         """Initialize the document loader.
 
         Args:
             paths: List of directory paths to load documents from.
             base_dir: Base directory for relative paths. Defaults to current directory.
+            max_workers: Maximum number of files read concurrently.
         """
         self.base_dir = Path(base_dir) if base_dir else Path.cwd()
         self.paths = [self.base_dir / p for p in paths]
+        self.max_workers = max(1, max_workers)
 
     def load(self) -> List[Document]:
         """Load all Markdown files from the configured paths.
@@ -45,7 +51,7 @@ class DocumentLoader:
         Returns:
             List of Document objects with full file content.
         """
-        documents: List[Document] = []
+        md_files: List[Path] = []
 
         for path in self.paths:
             if not path.exists():
@@ -56,26 +62,37 @@ class DocumentLoader:
                 logger.warning("Path is not a directory: %s", path)
                 continue
 
-            for md_file in path.rglob("*.md"):
-                try:
-                    content = md_file.read_text(encoding="utf-8")
-                    relative_path = md_file.relative_to(self.base_dir)
-                    documents.append(
-                        Document(
-                            content=content,
-                            metadata={
-                                "source": relative_path.as_posix(),
-                                "filename": md_file.name,
-                            },
-                        )
-                    )
-                    logger.debug("Loaded document: %s", relative_path)
-                except Exception as e:
-                    logger.error("Failed to load %s: %s", md_file, e)
+            md_files.extend(path.rglob("*.md"))
+
+        workers = min(self.max_workers, len(md_files))
+        if workers > 1:
+            # Reads are I/O bound: fan them out so disk latency overlaps instead of adding up
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="doc-loader") as executor:
+                loaded = list(executor.map(self._load_file, md_files))
+        else:
+            loaded = [self._load_file(md_file) for md_file in md_files]
+        documents = [doc for doc in loaded if doc is not None]
 
         logger.info("Loaded %d documents from %d paths", len(documents), len(self.paths))
         return documents
 
+    def _load_file(self, md_file: Path) -> Optional[Document]:
+        """Read a single Markdown file, returning None if it cannot be loaded."""
+        try:
+            content = md_file.read_text(encoding="utf-8")
+            relative_path = md_file.relative_to(self.base_dir)
+            logger.debug("Loaded document: %s", relative_path)
+            return Document(
+                content=content,
+                metadata={
+                    "source": relative_path.as_posix(),
+                    "filename": md_file.name,
+                },
+            )
+        except Exception as e:
+            logger.error("Failed to load %s: %s", md_file, e)
+            return None
+
 
 class TextSplitter:
     """Splits text into chunks while preserving Markdown structure."""
@@ -111,22 +128,28 @@ class TextSplitter:
         Returns:
             Most recent heading text, or empty string if none found.
         """
-        heading_pattern = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
-        headings = []
-
-        for match in heading_pattern.finditer(text):
-            if match.start() <= position:
-                level = len(match.group(1))
-                heading_text = match.group(2).strip()
-                headings.append((level, heading_text, match.start()))
-            else:
-                break
+        return self._heading_at(self._heading_index(text), position)
 
-        if not headings:
-            return ""
+    @staticmethod
+    def _heading_index(text: str) -> Tuple[List[int], List[str]]:
+        """Scan the text once for Markdown headings.
 
-        # Return the most recent heading
-        return headings[-1][1]
+        Returns:
+            Heading start offsets (ascending) and the matching heading texts.
+        """
+        starts: List[int] = []
+        titles: List[str] = []
+        for match in _HEADING_PATTERN.finditer(text):
+            starts.append(match.start())
+            titles.append(match.group(2).strip())
+        return starts, titles
+
+    @staticmethod
+    def _heading_at(index: Tuple[List[int], List[str]], position: int) -> str:
+        """Return the last heading starting at or before ``position`` from a heading index."""
+        starts, titles = index
+        i = bisect_right(starts, position)
+        return titles[i - 1] if i else ""
 
     def split(self, documents: List[Document]) -> List[Document]:
         """Split documents into smaller chunks.
@@ -161,6 +184,8 @@ class TextSplitter:
 
         chunks: List[Document] = []
         current_pos = 0
+        # Index headings once instead of rescanning the document for every chunk
+        headings = self._heading_index(text)
 
         while current_pos < len(text):
             # Calculate chunk end position
@@ -174,7 +199,7 @@ class TextSplitter:
 
             if chunk_text:
                 # Get heading context for this chunk
-                heading = self._extract_heading_context(text, current_pos)
+                heading = self._heading_at(headings, current_pos)
                 chunk_metadata = metadata.copy()
                 if heading:
                     chunk_metadata["heading"] = heading
@@ -38,6 +38,10 @@ class VectorStore:
         self._collection: Optional[Any] = None
         self._embedding_fn: Optional[Any] = None
         self._initialized = False
+        # Last known document count; None until counted or after writes of unknown effect
+        self._count: Optional[int] = None
+        # Bumped by every write so a count() that overlapped one does not cache its result
+        self._write_generation = 0
 
     @property
     def initialized(self) -> bool:
@@ -125,11 +129,17 @@ class VectorStore:
             texts = [doc.content for doc in documents]
             metadatas = [doc.metadata for doc in documents]
 
-            self._collection.add(
-                ids=ids,
-                documents=texts,
-                metadatas=metadatas,
-            )
+            # Duplicate IDs may be skipped, so recount lazily instead of adding len(documents)
+            self._invalidate_count()
+            try:
+                self._collection.add(
+                    ids=ids,
+                    documents=texts,
+                    metadatas=metadatas,
+                )
+            finally:
+                # A count() taken while the add (and its embedding) was running is already stale
+                self._invalidate_count()
 
             logger.info("Added %d documents to vector store", len(documents))
             return len(documents)
@@ -164,15 +174,7 @@ class VectorStore:
                 n_results=k,
             )
 
-            documents = []
-            if results and results.get("documents"):
-                for i, doc_text in enumerate(results["documents"][0]):
-                    metadata: Dict[str, Any] = {}
-                    if results.get("metadatas") and results["metadatas"][0]:
-                        metadata = results["metadatas"][0][i] or {}
-
-                    documents.append(Document(content=doc_text, metadata=metadata))
-
+            documents = self._result_documents(results, 0)
             logger.debug("Search for '%s' returned %d results", query[:50], len(documents))
             return documents
 
@@ -180,6 +182,60 @@ class VectorStore:
             logger.error("Search failed: %s", e)
             return []
 
+    def search_batch(self, queries: List[str], ks: List[int]) -> List[List[Document]]:
+        """Search for several queries with a single embedding/index round trip.
+
+        Args:
+            queries: Search query strings.
+            ks: Number of results to return for each query.
+
+        Returns:
+            One list of matching Document objects per query, in input order.
+        """
+        batch: List[List[Document]] = [[] for _ in queries]
+        if not self._ensure_initialized() or self._collection is None:
+            return batch
+
+        rows = [i for i, query in enumerate(queries) if query.strip()]
+        if not rows:
+            return batch
+
+        try:
+            results = self._collection.query(
+                query_texts=[queries[i] for i in rows],
+                n_results=max(ks[i] for i in rows),
+            )
+            for row, i in enumerate(rows):
+                batch[i] = self._result_documents(results, row)[: ks[i]]
+            logger.debug("Batched search for %d queries", len(rows))
+        except Exception as e:
+            logger.error("Batched search failed: %s", e)
+        return batch
+
+    @staticmethod
+    def _result_documents(results: Any, row: int) -> List[Document]:
+        """Build Document objects for one query row of a ChromaDB query result."""
+        documents = []
+        if results and results.get("documents"):
+            metadatas = results.get("metadatas")
+            for i, doc_text in enumerate(results["documents"][row]):
+                metadata: Dict[str, Any] = {}
+                if metadatas and metadatas[row]:
+                    metadata = metadatas[row][i] or {}
+
+                documents.append(Document(content=doc_text, metadata=metadata))
+        return documents
+
+    @property
+    def cached_count(self) -> Optional[int]:
+        """Document count known without querying the store, or None if it must be counted."""
+        return self._count
+
+    def _invalidate_count(self) -> None:
+        """Forget the cached document count after a write."""
+        self._count = None
+        self._write_generation += 1
+
     def count(self) -> int:
         """Get the number of documents in the store.
 
@@ -193,7 +249,11 @@ class VectorStore:
             return -1
 
         try:
-            return self._collection.count()
+            generation = self._write_generation
+            count = self._collection.count()
+            if generation == self._write_generation:
+                self._count = count
+            return count
         except Exception as e:
             logger.error("Failed to count documents: %s", e)
             return -1
@@ -218,6 +278,8 @@ class VectorStore:
                 embedding_function=self._embedding_fn,
                 metadata={"hnsw:space": "cosine"},
             )
+            self._write_generation += 1
+            self._count = 0
             logger.info("Cleared vector store")
             return True
         except Exception as e:
@@ -2,9 +2,10 @@
 
 import logging
 import os
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, Iterator, List, Optional, cast
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +69,9 @@ class ModelManager:
     # Supported model file extensions
     MODEL_EXTENSIONS = {".pt", ".onnx", ".tflite", ".gguf", ".bin"}
 
+    # Upper bound for the back-off after consecutive failed Ollama connections (seconds)
+    OLLAMA_RETRY_MAX_SECONDS = 30.0
+
     # Category detection patterns
     CATEGORY_PATTERNS = {
         "vision": ["yolo", "detection", "vision", "mediapipe"],
@@ -136,6 +140,8 @@ class ModelManager:
         self._seen_model_paths: set[Path] = set()
         self._active_models: Optional[ActiveModels] = None
         self._ollama_models: List[Dict[str, Any]] = []
+        # Per Ollama host: (consecutive connection failures, monotonic time of the next attempt)
+        self._ollama_backoff: Dict[str, tuple[int, float]] = {}
         self._providers_config: Dict[str, Any] = {}
         self._project_root = Path(__file__).resolve().parents[2]
         self._slot_field_map: Dict[str, tuple[str, str]] = {
@@ -145,44 +151,84 @@ class ModelManager:
             "text": ("text", "model"),
         }
 
-    def scan_local_models(self) -> List[ModelInfo]:
+    @property
+    def providers_config(self) -> Dict[str, Any]:
+        """Raw providers.toml contents from the last get_active_models() call."""
+        return self._providers_config
+
+    def scan_local_models(self, providers_config: Optional[Dict[str, Any]] = None) -> List[ModelInfo]:
         """
         Scan the models directory for installed model files.
 
+        Args:
+            providers_config: Already loaded providers.toml contents. Pass it when
+                scanning off the event loop so the scan does not reload (and replace)
+                the shared active configuration.
+
         Returns:
             List of detected ModelInfo objects
         """
-        self._installed_models = []
-        self._seen_model_paths = set()
+        # Build the inventory locally and publish it at the end: scans run in worker threads,
+        # so concurrent scans must not interleave and readers must never see a half-built list.
+        installed: List[ModelInfo] = []
+        seen: set[Path] = set()
 
         if not self.models_dir.exists():
             logger.warning("Models directory does not exist: %s", self.models_dir)
             if self._should_seed_demo_models():
-                self._seed_demo_models()
-            return self._installed_models
-
-        for root, _, files in os.walk(self.models_dir):
-            for file in files:
-                ext = Path(file).suffix.lower()
-                if ext in self.MODEL_EXTENSIONS:
-                    file_path = Path(root) / file
-                    self._register_model_file(file_path)
-
-        if not self._installed_models and self._should_seed_demo_models():
-            self._seed_demo_models()
-
-        self._include_active_config_models()
-
-        logger.info("Scanned %d local models", len(self._installed_models))
-        return self._installed_models
+                installed = self._demo_models()
+            self._installed_models, self._seen_model_paths = installed, seen
+            return installed
+
+        for entry in self._iter_files(str(self.models_dir)):
+            if os.path.splitext(entry.name)[1].lower() in self.MODEL_EXTENSIONS:
+                try:
+                    size_bytes: Optional[int] = entry.stat().st_size
+                except OSError:
+                    size_bytes = None
+                self._register_model_file(Path(entry.path), installed, seen, size_bytes)
+
+        if not installed and self._should_seed_demo_models():
+            installed = self._demo_models()
+
+        self._include_active_config_models(installed, seen, providers_config)
+
+        self._installed_models, self._seen_model_paths = installed, seen
+        logger.info("Scanned %d local models", len(installed))
+        return installed
+
+    @classmethod
+    def _iter_files(cls, directory: str) -> Iterator[os.DirEntry]:
+        """Yield non-directory entries below ``directory`` in os.walk order.
+
+        Uses os.scandir directly so the directory entries (and their cached
+        type information) are reused instead of re-stat'ing every path.
+        Symlinked directories are not followed, matching os.walk's default.
+        """
+        subdirs: List[str] = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        yield entry
+                    elif not entry.is_symlink():
+                        subdirs.append(entry.path)
+        except OSError:
+            return
+        for subdir in subdirs:
+            yield from cls._iter_files(subdir)
 
     def _should_seed_demo_models(self) -> bool:
         """Return True when demo models should be injected."""
         return self._using_default_models_dir and _is_test_mode()
 
-    def _seed_demo_models(self) -> None:
-        """Populate deterministic demo models used in TEST_MODE."""
-        self._installed_models = [
+    def _demo_models(self) -> List[ModelInfo]:
+        """Build the deterministic demo models used in TEST_MODE."""
+        models = [
             ModelInfo(
                 name=str(entry["name"]),
                 path=str(entry["path"]),
@@ -193,10 +239,11 @@ class ModelManager:
             )
             for entry in self.DEMO_LOCAL_MODELS
         ]
-        logger.info("Seeded %d demo models for TEST_MODE", len(self._installed_models))
+        logger.info("Seeded %d demo models for TEST_MODE", len(models))
+        return models
 
-    def _create_model_info(self, file_path: Path) -> ModelInfo:
-        """Create ModelInfo from a file path."""
+    def _create_model_info(self, file_path: Path, size_bytes: Optional[int] = None) -> ModelInfo:
+        """Create ModelInfo from a file path (``size_bytes`` skips the stat when already known)."""
         name = file_path.stem
         ext = file_path.suffix.lower().lstrip(".")
 
@@ -204,10 +251,12 @@ class ModelManager:
         category, model_type = self._detect_category_and_type(name.lower())
 
         # Get file size in MB
-        try:
-            size_mb = file_path.stat().st_size / (1024 * 1024)
-        except OSError:
-            size_mb = 0.0
+        if size_bytes is None:
+            try:
+                size_bytes = file_path.stat().st_size
+            except OSError:
+                size_bytes = 0
+        size_mb = size_bytes / (1024 * 1024)
 
         return ModelInfo(
             name=name,
@@ -220,21 +269,32 @@ class ModelManager:
             format=ext,
         )
 
-    def _register_model_file(self, file_path: Path) -> None:
-        """Register a model file if it hasn't been seen yet."""
+    def _register_model_file(
+        self,
+        file_path: Path,
+        installed: List[ModelInfo],
+        seen: set[Path],
+        size_bytes: Optional[int] = None,
+    ) -> None:
+        """Add a model file to ``installed`` if its resolved path is not in ``seen`` yet."""
         try:
             resolved = file_path.resolve()
         except OSError:
             resolved = file_path
-        if resolved in self._seen_model_paths:
+        if resolved in seen:
             return
 
-        model_info = self._create_model_info(file_path)
-        self._installed_models.append(model_info)
-        self._seen_model_paths.add(resolved)
+        model_info = self._create_model_info(file_path, size_bytes)
+        installed.append(model_info)
+        seen.add(resolved)
         logger.debug("Found model: %s (%s)", model_info.name, model_info.category)
 
-    def _include_active_config_models(self) -> None:
+    def _include_active_config_models(
+        self,
+        installed: List[ModelInfo],
+        seen: set[Path],
+        providers_config: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """Ensure models referenced by providers.toml appear in the inventory even if stored outside data/models."""
         # Only extend inventory with configured models when using default models directory.
         # Custom/test directories should reflect their own contents without pulling files
@@ -242,15 +302,17 @@ class ModelManager:
         if not self._using_default_models_dir:
             return
 
-        if not self._providers_config:
-            self.get_active_models()
+        if providers_config is None:
+            if not self._providers_config:
+                self.get_active_models()
+            providers_config = self._providers_config
 
-        vision_config = self._providers_config.get("vision", {})
+        vision_config = providers_config.get("vision", {})
         detection_model = vision_config.get("detection_model")
         if detection_model:
             for candidate in self._candidate_paths(detection_model):
                 if candidate.exists():
-                    self._register_model_file(candidate)
+                    self._register_model_file(candidate, installed, seen)
                     break
 
     def _candidate_paths(self, model_name: str) -> List[Path]:
@@ -304,11 +366,14 @@ class ModelManager:
         Returns:
             ActiveModels configuration object
         """
-        self._active_models = ActiveModels()
+        # Build the new configuration aside and publish it at the end, so a concurrent
+        # reader (e.g. scan_ollama_models) never sees a half-populated ActiveModels.
+        active = ActiveModels()
 
         if not self.providers_config_path.exists():
             logger.warning("Providers config not found: %s", self.providers_config_path)
-            return self._active_models
+            self._active_models = active
+            return active
 
         import importlib
         import importlib.util
@@ -326,7 +391,7 @@ class ModelManager:
 
             # Vision configuration
             vision_config = self._providers_config.setdefault("vision", {})
-            self._active_models.vision = {
+            active.vision = {
                 "model": vision_config.get("detection_model", "yolov8n"),
                 "enabled": vision_config.get("enabled", False),
                 "provider": "yolo",
@@ -335,13 +400,13 @@ class ModelManager:
 
             # Voice configuration
             voice_config = self._providers_config.setdefault("voice", {})
-            self._active_models.voice_asr = {
+            active.voice_asr = {
                 "model": voice_config.get("asr_model", "base"),
                 "enabled": voice_config.get("enabled", False),
                 "provider": "whisper",
                 "use_mock": voice_config.get("use_mock", False),
             }
-            self._active_models.voice_tts = {
+            active.voice_tts = {
                 "model": voice_config.get("tts_model", "en_US-lessac-medium"),
                 "enabled": voice_config.get("enabled", False),
                 "provider": "piper",
@@ -350,7 +415,7 @@ class ModelManager:
 
             # Text configuration
             text_config = self._providers_config.setdefault("text", {})
-            self._active_models.text = {
+            active.text = {
                 "model": text_config.get("model", "llama3.2:1b"),
                 "enabled": text_config.get("enabled", False),
                 "provider": "ollama",
@@ -364,12 +429,17 @@ class ModelManager:
             logger.error("Failed to read providers config: %s", e)
             self._providers_config = {}
 
-        return self._active_models
+        self._active_models = active
+        return active
 
     async def scan_ollama_models(self, ollama_host: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Query Ollama API for available LLM models.
 
+        After a failed connection the host is not queried again for a back-off
+        window (2, 4, 8... seconds, capped at OLLAMA_RETRY_MAX_SECONDS); calls
+        made meanwhile return the last result without touching the network.
+
         Args:
             ollama_host: Ollama API host URL (default from config)
 
@@ -388,6 +458,9 @@ class ModelManager:
                 else None
             )
         host = host or "http://localhost:11434"
+        fail_streak, retry_at = self._ollama_backoff.get(host, (0, 0.0))
+        if fail_streak and time.monotonic() < retry_at:
+            return self._ollama_models
         self._ollama_models = []
 
         try:
@@ -399,8 +472,12 @@ class ModelManager:
                     logger.info("Found %d Ollama models", len(self._ollama_models))
                 else:
                     logger.warning("Ollama API returned status %d", response.status_code)
+            self._ollama_backoff.pop(host, None)
         except Exception as e:
-            logger.debug("Could not connect to Ollama: %s", e)
+            fail_streak += 1
+            delay = min(2.0**fail_streak, self.OLLAMA_RETRY_MAX_SECONDS)
+            self._ollama_backoff[host] = (fail_streak, time.monotonic() + delay)
+            logger.debug("Could not connect to Ollama (retry in %.0fs): %s", delay, e)
 
         if not self._ollama_models and _is_test_mode():
             self._ollama_models = [dict(entry) for entry in self.DEMO_OLLAMA_MODELS]
@@ -9,7 +9,8 @@ import logging
 import time
 import socket
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from enum import IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,14 @@ class Tool:
     permissions: List[str] = field(default_factory=lambda: ["low"])
 
 
+class ToolErrorCode(IntEnum):
+    """Rodzaj błędu wywołania narzędzia (router mapuje go na status HTTP)."""
+
+    NONE = 0
+    NOT_FOUND = 1
+    INVALID = 2
+
+
 @dataclass
 class ToolInvokeResult:
     """Wynik wywołania narzędzia MCP.
@@ -43,6 +52,7 @@ class ToolInvokeResult:
         result: Wynik zwrócony przez handler.
         error: Opis błędu (jeśli ok=False).
         meta: Metadane wywołania (czas, host itp.).
+        error_code: Rodzaj błędu (nie jest częścią odpowiedzi JSON).
     """
 
     ok: bool
@@ -50,6 +60,7 @@ class ToolInvokeResult:
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     meta: Dict[str, Any] = field(default_factory=dict)
+    error_code: ToolErrorCode = ToolErrorCode.NONE
 
     def to_dict(self) -> Dict[str, Any]:
         """Konwertuj do słownika."""
@@ -71,10 +82,20 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: Dict[str, Tool] = {}
+        # Handler narzędzia i informacja, czy jest async - ustalane przy rejestracji, nie przy każdym wywołaniu
+        self._dispatch: Dict[str, Tuple[Callable[..., Any], bool]] = {}
         self._invocation_count: int = 0
         self._last_invoked_tool: Optional[str] = None
+        self._version: int = 0
+        # Nazwa hosta do metadanych wyniku - ustalana raz, nie przy każdym wywołaniu
+        self._hostname: str = socket.gethostname()
         self._logger = logging.getLogger("mcp.registry")
 
+    @property
+    def version(self) -> int:
+        """Licznik zmian zestawu narzędzi (rośnie przy każdej rejestracji/wyrejestrowaniu)."""
+        return self._version
+
     def register(self, tool: Tool) -> None:
         """Zarejestruj narzędzie w rejestrze.
 
@@ -87,6 +108,9 @@ class ToolRegistry:
         if tool.name in self._tools:
             raise ValueError(f"Tool '{tool.name}' already registered")
         self._tools[tool.name] = tool
+        if tool.handler is not None:
+            self._dispatch[tool.name] = (tool.handler, asyncio.iscoroutinefunction(tool.handler))
+        self._version += 1
         self._logger.debug("Registered tool: %s", tool.name)
 
     def unregister(self, name: str) -> bool:
@@ -100,6 +124,8 @@ class ToolRegistry:
         """
         if name in self._tools:
             del self._tools[name]
+            self._dispatch.pop(name, None)
+            self._version += 1
             self._logger.debug("Unregistered tool: %s", name)
             return True
         return False
@@ -134,6 +160,8 @@ class ToolRegistry:
     def clear(self) -> None:
         """Wyczyść rejestr (usuń wszystkie narzędzia)."""
         self._tools.clear()
+        self._dispatch.clear()
+        self._version += 1
         self._invocation_count = 0
         self._last_invoked_tool = None
 
@@ -154,15 +182,16 @@ class ToolRegistry:
             Wynik wywołania narzędzia.
         """
         start_time = time.time()
-        hostname = socket.gethostname()
+        hostname = self._hostname
 
-        tool = self.get(tool_name)
+        tool = self._tools.get(tool_name)
         if not tool:
             return ToolInvokeResult(
                 ok=False,
                 tool=tool_name,
                 error=f"Tool '{tool_name}' not found",
                 meta={"duration_ms": 0, "host": hostname},
+                error_code=ToolErrorCode.NOT_FOUND,
             )
 
         if not tool.handler:
@@ -171,6 +200,7 @@ class ToolRegistry:
                 tool=tool_name,
                 error=f"Tool '{tool_name}' has no handler",
                 meta={"duration_ms": 0, "host": hostname},
+                error_code=ToolErrorCode.INVALID,
             )
 
         # Sprawdź uprawnienia
@@ -180,15 +210,21 @@ class ToolRegistry:
                 tool=tool_name,
                 error="This tool requires user confirmation (confirm=true)",
                 meta={"duration_ms": 0, "host": hostname, "requires_confirm": True},
+                error_code=ToolErrorCode.INVALID,
             )
 
         try:
             args = arguments or {}
-            # Sprawdź czy handler jest async przed wywołaniem
-            if asyncio.iscoroutinefunction(tool.handler):
-                result = await tool.handler(**args)
+            handler = tool.handler
+            entry = self._dispatch.get(tool_name)
+            if entry is None or entry[0] is not handler:
+                # Handler podmieniony po rejestracji - ustal ponownie, czy jest async
+                entry = (handler, asyncio.iscoroutinefunction(handler))
+                self._dispatch[tool_name] = entry
+            if entry[1]:
+                result = await handler(**args)
             else:
-                result = tool.handler(**args)
+                result = handler(**args)
 
             duration_ms = int((time.time() - start_time) * 1000)
 
@@ -213,16 +249,20 @@ class ToolRegistry:
                 tool=tool_name,
                 error=error_msg,
                 meta={"duration_ms": duration_ms, "host": hostname},
+                error_code=ToolErrorCode.INVALID,
             )
         except Exception as e:
             duration_ms = int((time.time() - start_time) * 1000)
             error_msg = str(e)
             self._logger.error("Tool '%s' invocation failed: %s", tool_name, error_msg)
+            # Brakujący plik lub klucz zgłoszony przez handler to brak zasobu, nie błędne żądanie
+            missing = isinstance(e, (FileNotFoundError, KeyError))
             return ToolInvokeResult(
                 ok=False,
                 tool=tool_name,
                 error=error_msg,
                 meta={"duration_ms": duration_ms, "host": hostname},
+                error_code=ToolErrorCode.NOT_FOUND if missing else ToolErrorCode.INVALID,
             )
 
     def get_stats(self) -> Dict[str, Any]:
@@ -4,6 +4,7 @@ This module provides a service layer for interacting with Google Assistant API.
 Devices are defined in a static TOML configuration file.
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -162,12 +163,15 @@ class GoogleAssistantService:
         self._device_status: Dict[str, str] = {}  # Optimistic status tracking
         self._command_history: List[CommandHistoryEntry] = []
         self._config_mtime: float = 0.0
+        self._tokens_mtime: float = 0.0
+        self._tokens_data: Optional[Dict[str, Any]] = None
         self._max_history_size = 100
         self._credentials: Optional[GoogleCredentials] = None
         self._http_request: Optional[GoogleAuthRequest] = None
         self._assistant_endpoint = "embeddedassistant.googleapis.com"
         self._grpc_deadline = 20  # seconds
         self._conversation_state: Optional[bytes] = None
+        self._live_lock: Optional[asyncio.Lock] = None  # created on first live command, on the running loop
 
         if self.enabled:
             self._load_config()
@@ -232,14 +236,23 @@ class GoogleAssistantService:
         }
 
     def _load_tokens_from_file(self) -> Optional[Dict[str, Any]]:
-        """Read OAuth tokens JSON if available."""
-        if not self.tokens_path or not self.tokens_path.exists():
+        """Read OAuth tokens JSON if available (re-parsed only when the file changes)."""
+        if not self.tokens_path:
+            return None
+        try:
+            current_mtime = self.tokens_path.stat().st_mtime
+        except OSError:
+            self._tokens_mtime, self._tokens_data = 0.0, None
             return None
+        if current_mtime == self._tokens_mtime:
+            return self._tokens_data
         try:
-            return json.loads(self.tokens_path.read_text())
+            data = json.loads(self.tokens_path.read_text())
         except Exception as exc:  # pragma: no cover - IO error
             logger.error("Failed to read tokens file %s: %s", self.tokens_path, exc)
-            return None
+            data = None
+        self._tokens_mtime, self._tokens_data = current_mtime, data
+        return data
 
     def _build_credentials(self) -> Optional[GoogleCredentials]:
         """Build google.oauth2.credentials.Credentials from stored tokens."""
@@ -294,6 +307,7 @@ class GoogleAssistantService:
         try:
             self.tokens_path.parent.mkdir(parents=True, exist_ok=True)
             self.tokens_path.write_text(json.dumps(payload, indent=2))
+            self._tokens_mtime = 0.0
         except Exception as exc:  # pragma: no cover - IO error
             logger.warning("Failed to persist refreshed token: %s", exc)
 
@@ -504,6 +518,15 @@ class GoogleAssistantService:
         if not GOOGLE_ASSISTANT_SDK_AVAILABLE:
             return {"ok": False, "error": "google_assistant_sdk_missing"}
 
+        # Token refresh, token-file writes and the gRPC stream all block, so run them in a
+        # worker thread; the lock keeps conversation_state updates in order.
+        if self._live_lock is None:
+            self._live_lock = asyncio.Lock()
+        async with self._live_lock:
+            return await asyncio.to_thread(self._execute_live_command, command_text)
+
+    def _execute_live_command(self, command_text: str) -> Dict[str, Any]:
+        """Run one blocking Assistant round trip (called from a worker thread)."""
         if not self._live_ready():
             return {"ok": False, "error": "assistant_live_config_missing"}
 
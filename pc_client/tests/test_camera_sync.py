@@ -1,9 +1,14 @@
 from datetime import datetime, timezone
 from types import SimpleNamespace
 
+import httpx
 import pytest
+from fastapi.testclient import TestClient
 
 from pc_client.api import lifecycle
+from pc_client.api.server import create_app
+from pc_client.cache import CacheManager
+from pc_client.config import Settings
 
 
 def test_last_modified_timestamp_parses_header():
@@ -29,6 +34,61 @@ async def test_fetch_and_store_camera_frame_updates_state():
     await lifecycle._fetch_and_store_camera_frame(app)
 
     assert app.state.last_camera_frame["content"] == b"frame"
+    assert app.state.last_camera_frame["length"] == len(b"frame")
     assert app.state.last_camera_frame["media_type"] == "image/jpeg"
     expected = datetime(2023, 1, 2, 15, 4, 5, tzinfo=timezone.utc).timestamp()
     assert app.state.last_camera_frame["timestamp"] == expected
+
+
+def test_camera_last_head_reports_cached_length_without_body():
+    app = create_app(Settings(), CacheManager())
+    app.state.last_camera_frame = {
+        "content": b"0123456789",
+        "length": 10,
+        "media_type": "image/jpeg",
+        "timestamp": 0,
+    }
+    client = TestClient(app)
+
+    resp = client.head("/camera/last")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-length"] == "10"
+    assert resp.headers["content-type"] == "image/jpeg"
+    assert resp.content == b""
+
+
+def test_media_proxy_preserves_repeated_query_params():
+    captured = {}
+
+    class DummyAdapter:
+        async def fetch_binary(self, path: str, params=None):
+            captured["path"] = path
+            captured["params"] = list(params)
+            return b"img", "image/jpeg", httpx.Headers({"Content-Type": "image/jpeg", "X-Frame": "7"})
+
+    app = create_app(Settings(), CacheManager())
+    app.state.rest_adapter = DummyAdapter()
+    client = TestClient(app)
+
+    resp = client.get("/snapshots/obstacle.jpg?tag=a&tag=b")
+
+    assert resp.status_code == 200
+    assert resp.content == b"img"
+    assert resp.headers["x-frame"] == "7"
+    assert resp.headers.get_list("content-type") == ["image/jpeg"]
+    assert captured == {"path": "/snapshots/obstacle.jpg", "params": [("tag", "a"), ("tag", "b")]}
+
+
+def test_media_proxy_with_mock_adapter_sends_one_content_type():
+    from pc_client.adapters.mock_rest_adapter import MockRestAdapter
+
+    app = create_app(Settings(), CacheManager())
+    app.state.rest_adapter = MockRestAdapter()
+    client = TestClient(app)
+
+    resp = client.get("/vision/cam")
+
+    assert resp.status_code == 200
+    assert resp.headers.get_list("content-type") == ["image/png"]
+    assert resp.headers["last-modified"] == "Thu, 01 Jan 2025 00:00:00 GMT"
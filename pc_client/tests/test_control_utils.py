@@ -0,0 +1,55 @@
+"""Tests for the control router's local fallback helpers."""
+
+import pytest
+
+from pc_client.api import control_utils
+
+
+def test_normalize_tracking_request_defaults_and_validation():
+    assert control_utils.normalize_tracking_request({"mode": "Face"}) == ("face", True)
+    assert control_utils.normalize_tracking_request({"mode": "hand", "enabled": False}) == ("none", False)
+    with pytest.raises(ValueError):
+        control_utils.normalize_tracking_request({"mode": "lidar"})
+
+
+def test_local_logic_summary_statuses():
+    services = [
+        {"unit": "rider-cam-preview.service", "active": "active"},
+        {"unit": "rider-vision.service", "active": "active"},
+    ]
+    control_state = {"tracking": {"enabled": False}, "navigator": {"active": False}}
+
+    summary = control_utils.local_logic_summary(services, control_state)["summary"]
+
+    statuses = {row["name"]: row["status"] for row in summary["features"]}
+    assert statuses == {"s0_manual": "active", "s3_follow_me_face": "inactive", "s4_recon": "partial"}
+    assert summary["counts"] == {"total": 3, "active": 1, "partial": 1}
+
+
+def test_service_entry_uses_first_entry_per_unit():
+    services = [
+        {"unit": "rider-vision.service", "active": "active", "enabled": "enabled"},
+        {"unit": "rider-vision.service", "active": "inactive"},
+    ]
+    by_unit = control_utils.services_by_unit(services)
+
+    entry = control_utils.service_entry("rider-vision.service", by_unit)
+    assert entry["is_active"] is True and entry["is_enabled"] is True
+    missing = control_utils.service_entry("rider-tracker.service", by_unit)
+    assert missing["unit"] == "rider-tracker.service" and missing["is_active"] is False
+
+
+@pytest.mark.parametrize(
+    "state_key, tracking, recon, expected",
+    [
+        ("tracking", True, False, True),
+        ("tracking", False, True, False),
+        ("recon", False, True, True),
+        ("recon", True, False, False),
+        ("zero", False, False, True),
+        ("zero", True, True, False),
+        ("unknown", True, True, False),
+    ],
+)
+def test_is_feature_active_table(state_key, tracking, recon, expected):
+    assert control_utils.is_feature_active({"state_key": state_key}, tracking, recon) is expected
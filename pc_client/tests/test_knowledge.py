@@ -8,6 +8,15 @@ import tempfile
 from pc_client.core.knowledge.ingest import Document, DocumentLoader, TextSplitter
 
 
+def _request():
+    """Minimal stand-in for a FastAPI request with its own app state."""
+    from types import SimpleNamespace
+
+    from starlette.datastructures import State
+
+    return SimpleNamespace(app=SimpleNamespace(state=State()))
+
+
 class TestDocument:
     """Tests for Document dataclass."""
 
@@ -94,6 +103,19 @@ class TestDocumentLoader:
             assert docs[0].metadata["source"] == "docs/test.md"
             assert docs[0].metadata["filename"] == "test.md"
 
+    def test_parallel_load_keeps_order_and_skips_unreadable(self):
+        """Should read files concurrently, keep discovery order and skip failures."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "docs").mkdir()
+            for i in range(6):
+                (Path(tmpdir) / "docs" / f"doc{i}.md").write_text(f"Content {i}")
+            (Path(tmpdir) / "docs" / "broken.md").write_bytes(b"\xff\xfe\xfa")
+
+            loader = DocumentLoader(paths=["docs"], base_dir=tmpdir, max_workers=4)
+            expected = [p.name for p in loader.paths[0].rglob("*.md") if p.name != "broken.md"]
+            docs = loader.load()
+            assert [d.metadata["filename"] for d in docs] == expected
+
 
 class TestTextSplitter:
     """Tests for TextSplitter class."""
@@ -168,6 +190,24 @@ class TestTextSplitter:
         heading = splitter._extract_heading_context(text, len(text) - 5)
         assert heading == "H3"
 
+    def test_split_assigns_nearest_preceding_heading(self):
+        """Should tag each chunk with the last heading at or before its start."""
+        import re
+
+        splitter = TextSplitter(chunk_size=60, chunk_overlap=10)
+        sections = [f"## Section {i}\n\n" + "Body sentence here. " * (i + 2) for i in range(6)]
+        text = "# Title\n\n" + "\n\n".join(sections)
+        chunks = splitter.split([Document(content=text, metadata={"source": "t.md"})])
+        assert len(chunks) > 6
+
+        heading_re = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
+        pos = 0
+        for chunk in chunks:
+            start = text.index(chunk.content, pos)
+            pos = start
+            before = [m.group(1).strip() for m in heading_re.finditer(text) if m.start() <= start]
+            assert chunk.metadata.get("heading", "") == (before[-1] if before else "")
+
     def test_extract_heading_context_empty(self):
         """Should return empty string when no headings."""
         splitter = TextSplitter(chunk_size=100, chunk_overlap=10)
@@ -231,6 +271,94 @@ class TestVectorStoreMock:
             count = store.count()
             assert count == -1
 
+    def test_count_is_cached_until_a_write(self):
+        """Should remember the count, forget it on add and reset it on clear."""
+        from unittest.mock import MagicMock
+
+        from pc_client.core.knowledge.store import VectorStore
+
+        store = VectorStore()
+        store._client = MagicMock()
+        store._embedding_fn = MagicMock()
+        store._collection = MagicMock()
+        store._collection.count.return_value = 7
+        with patch.object(store, "_ensure_initialized", return_value=True):
+            assert store.cached_count is None
+            assert store.count() == 7
+            assert store.cached_count == 7
+
+            store.add_documents([Document(content="new", metadata={"source": "n.md"})])
+            assert store.cached_count is None
+
+            store._client.get_or_create_collection.return_value = MagicMock()
+            assert store.clear() is True
+            assert store.cached_count == 0
+
+    def test_count_taken_during_add_is_not_cached(self):
+        """Should not keep a count that was read while documents were being added."""
+        import threading
+        from unittest.mock import MagicMock
+
+        from pc_client.core.knowledge.store import VectorStore
+
+        store = VectorStore()
+        store._collection = MagicMock()
+        rows = [0]
+        store._collection.count.side_effect = lambda: rows[0]
+
+        def slow_add(ids, documents, metadatas):
+            # A status poll lands while the add (embedding) is still running
+            assert store.count() == 0
+            rows[0] += len(ids)
+
+        store._collection.add.side_effect = slow_add
+        docs = [Document(content=f"doc {i}", metadata={"source": f"{i}.md"}) for i in range(5)]
+        with patch.object(store, "_ensure_initialized", return_value=True):
+            assert store.add_documents(docs) == 5
+            assert store.cached_count is None
+            assert store.count() == 5
+
+            # A count that starts before an add and finishes after it must not be cached either
+            count_started = threading.Event()
+            add_done = threading.Event()
+
+            def blocked_count():
+                stale = rows[0]
+                count_started.set()
+                add_done.wait(timeout=5)
+                return stale
+
+            store._collection.count.side_effect = blocked_count
+            poller = threading.Thread(target=store.count)
+            poller.start()
+            assert count_started.wait(timeout=5)
+            store._collection.add.side_effect = lambda ids, documents, metadatas: rows.__setitem__(0, rows[0] + 1)
+            store.add_documents([Document(content="late", metadata={"source": "late.md"})])
+            add_done.set()
+            poller.join(timeout=5)
+            assert store.cached_count is None
+
+    def test_search_batch_issues_one_query_and_trims_per_k(self):
+        """Should embed all non-empty queries in one call and honour each k."""
+        from unittest.mock import MagicMock
+
+        from pc_client.core.knowledge.store import VectorStore
+
+        store = VectorStore()
+        store._collection = MagicMock()
+        store._collection.query.return_value = {
+            "documents": [["a1", "a2", "a3"], ["b1", "b2", "b3"]],
+            "metadatas": [[{"source": "a.md"}, None, None], None],
+        }
+        with patch.object(store, "_ensure_initialized", return_value=True):
+            results = store.search_batch(["alpha", "  ", "beta"], [3, 5, 1])
+
+        store._collection.query.assert_called_once_with(query_texts=["alpha", "beta"], n_results=3)
+        assert [d.content for d in results[0]] == ["a1", "a2", "a3"]
+        assert results[0][0].metadata == {"source": "a.md"}
+        assert results[1] == []
+        assert [d.content for d in results[2]] == ["b1"]
+
 
 class TestKnowledgeRouterMock:
     """Tests for knowledge router endpoints with mocked dependencies."""
@@ -249,6 +377,15 @@ class TestKnowledgeRouterMock:
             data = json.loads(response.body.decode())
             assert data["enabled"] is False
 
+    def test_docs_paths_are_parsed_once_per_value(self):
+        """Should cache the split docs path list per raw settings value."""
+        from pc_client.api.routers.knowledge_router import _parse_docs_paths
+
+        first = _parse_docs_paths(" docs_pl, ,docs ")
+        assert first == ("docs_pl", "docs")
+        assert _parse_docs_paths(" docs_pl, ,docs ") is first
+        assert _parse_docs_paths("other") == ("other",)
+
     @pytest.mark.asyncio
     async def test_search_when_rag_disabled(self):
         """Should return error when RAG is not enabled."""
@@ -257,7 +394,7 @@ class TestKnowledgeRouterMock:
 
             from pc_client.api.routers.knowledge_router import search_knowledge_base
 
-            response = await search_knowledge_base(q="test")
+            response = await search_knowledge_base(_request(), q="test")
             assert response.status_code == 400
 
     @pytest.mark.asyncio
@@ -268,11 +405,15 @@ class TestKnowledgeRouterMock:
 
             from pc_client.api.routers.knowledge_router import search_knowledge_base
 
-            response = await search_knowledge_base(q="")
+            response = await search_knowledge_base(_request(), q="")
             assert response.status_code == 400
             data = response.body.decode()
             assert "required" in data.lower()
 
+            response = await search_knowledge_base(_request(), q=" \t\n")
+            assert response.status_code == 400
+            assert "required" in response.body.decode().lower()
+
     @pytest.mark.asyncio
     async def test_reindex_when_rag_disabled(self):
         """Should return error when RAG is not enabled."""
@@ -290,15 +431,14 @@ class TestKnowledgeRouterMock:
     async def test_successful_blocking_reindex(self):
         """Should successfully reindex documents when RAG is enabled."""
         import json
-        from unittest.mock import MagicMock, AsyncMock
+        from unittest.mock import MagicMock
 
         with (
             patch("pc_client.api.routers.knowledge_router.settings") as mock_settings,
             patch("pc_client.api.routers.knowledge_router._get_vector_store") as mock_get_store,
             patch("pc_client.api.routers.knowledge_router.DocumentLoader") as mock_loader_class,
             patch("pc_client.api.routers.knowledge_router.TextSplitter") as mock_splitter_class,
-            patch("pc_client.api.routers.knowledge_router._reindex_in_progress", False),
-            patch("pc_client.api.routers.knowledge_router._reindex_lock", AsyncMock()),
+            patch("pc_client.api.routers.knowledge_router._reindex_future", None),
         ):
             mock_settings.rag_enabled = True
             mock_settings.rag_docs_paths = "docs_pl,docs"
@@ -333,6 +473,36 @@ class TestKnowledgeRouterMock:
             assert data["documents_loaded"] == 1
             assert data["chunks_indexed"] == 1
 
+    @pytest.mark.asyncio
+    async def test_concurrent_reindex_callers_share_one_run(self):
+        """Should coalesce concurrent reindex requests into a single run."""
+        import asyncio
+
+        from pc_client.api.routers import knowledge_router
+
+        calls = []
+        release = asyncio.Event()
+
+        async def fake_run():
+            calls.append("run")
+            await release.wait()
+            return {"ok": True, "chunks_indexed": 3}
+
+        with (
+            patch("pc_client.api.routers.knowledge_router._run_reindex", fake_run),
+            patch("pc_client.api.routers.knowledge_router._reindex_future", None),
+        ):
+            pending = [asyncio.ensure_future(knowledge_router._perform_reindex()) for _ in range(3)]
+            await asyncio.sleep(0)
+            assert knowledge_router._reindex_future is not None
+            release.set()
+            results = await asyncio.gather(*pending)
+            await asyncio.sleep(0)
+
+            assert calls == ["run"]
+            assert results == [{"ok": True, "chunks_indexed": 3}] * 3
+            assert knowledge_router._reindex_future is None
+
     @pytest.mark.asyncio
     async def test_successful_search_with_results(self):
         """Should return search results when RAG is enabled and documents exist."""
@@ -354,7 +524,7 @@ class TestKnowledgeRouterMock:
 
             from pc_client.api.routers.knowledge_router import search_knowledge_base
 
-            response = await search_knowledge_base(q="test query", k=3)
+            response = await search_knowledge_base(_request(), q="test query", k=3)
             data = json.loads(response.body.decode())
 
             assert response.status_code == 200
@@ -364,6 +534,75 @@ class TestKnowledgeRouterMock:
             assert data["results"][0]["content"] == "Found content"
             assert data["results"][0]["source"] == "docs/found.md"
 
+    @pytest.mark.asyncio
+    async def test_slow_lookup_does_not_block_others_and_overflow_is_batched(self):
+        """Should run lookups in parallel up to the limit and batch queries queued behind busy workers."""
+        import asyncio
+        import threading
+        from unittest.mock import MagicMock
+
+        from pc_client.api.routers import knowledge_router
+
+        release = threading.Event()
+        slow_started = threading.Event()
+        batch_started = threading.Event()
+
+        def search(query, k):
+            if query == "slow":
+                slow_started.set()
+                release.wait(5)
+            return [Document(content=query)]
+
+        def search_batch(queries, ks):
+            batch_started.set()
+            return [[Document(content=q)] for q in queries]
+
+        mock_store = MagicMock()
+        mock_store.search.side_effect = search
+        mock_store.search_batch.side_effect = search_batch
+        app_state = _request().app.state
+
+        with (
+            patch.object(knowledge_router, "MAX_CONCURRENT_SEARCHES", 2),
+            patch.object(knowledge_router, "_get_vector_store", return_value=mock_store),
+        ):
+            slow = asyncio.ensure_future(knowledge_router._search(app_state, "slow", 3))
+            while not slow_started.is_set():
+                await asyncio.sleep(0.001)
+
+            # A second slot is free: a fast query is answered while the slow one is still running
+            fast = await asyncio.wait_for(knowledge_router._search(app_state, "fast", 1), timeout=2)
+            assert fast[0].content == "fast"
+            assert not slow.done()
+
+            # Occupy the second slot, then queue more queries behind both busy workers
+            blocker_release = threading.Event()
+            blocker_started = threading.Event()
+
+            def blocking_search(query, k):
+                if query == "slow":
+                    return search(query, k)
+                blocker_started.set()
+                blocker_release.wait(5)
+                return [Document(content=query)]
+
+            mock_store.search.side_effect = blocking_search
+            blocker = asyncio.ensure_future(knowledge_router._search(app_state, "blocker", 1))
+            while not blocker_started.is_set():
+                await asyncio.sleep(0.001)
+            rest = [asyncio.ensure_future(knowledge_router._search(app_state, f"q{i}", 2)) for i in range(3)]
+            await asyncio.sleep(0)
+            assert len(app_state.knowledge_search_workers) == 2
+
+            blocker_release.set()
+            release.set()
+            results = await asyncio.gather(slow, blocker, *rest)
+
+        assert [docs[0].content for docs in results] == ["slow", "blocker", "q0", "q1", "q2"]
+        mock_store.search_batch.assert_called_once_with(["q0", "q1", "q2"], [2, 2, 2])
+        assert app_state.knowledge_search_workers == set()
+        assert app_state.knowledge_search_queue == []
+
     @pytest.mark.asyncio
     async def test_successful_status_when_initialized(self):
         """Should return initialized status when RAG is enabled and store is ready."""
@@ -373,7 +612,7 @@ class TestKnowledgeRouterMock:
         with (
             patch("pc_client.api.routers.knowledge_router.settings") as mock_settings,
             patch("pc_client.api.routers.knowledge_router._get_vector_store") as mock_get_store,
-            patch("pc_client.api.routers.knowledge_router._reindex_in_progress", False),
+            patch("pc_client.api.routers.knowledge_router._reindex_future", None),
         ):
             mock_settings.rag_enabled = True
             mock_settings.embedding_model = "all-MiniLM-L6-v2"
@@ -382,6 +621,7 @@ class TestKnowledgeRouterMock:
             # Mock vector store
             mock_store = MagicMock()
             mock_store.initialized = True
+            mock_store.cached_count = None
             mock_store.count.return_value = 10
             mock_get_store.return_value = mock_store
 
@@ -407,7 +647,7 @@ class TestKnowledgeRouterMock:
             from pc_client.api.routers.knowledge_router import search_knowledge_base
 
             long_query = "x" * 1001  # Exceeds MAX_QUERY_LENGTH of 1000
-            response = await search_knowledge_base(q=long_query, k=3)
+            response = await search_knowledge_base(_request(), q=long_query, k=3)
             data = json.loads(response.body.decode())
 
             assert response.status_code == 400
@@ -1,5 +1,6 @@
 """Tests for MockRestAdapter."""
 
+import httpx
 import pytest
 from pc_client.adapters.mock_rest_adapter import MockRestAdapter
 
@@ -45,8 +46,10 @@ async def test_mock_adapter_fetch_binary(mock_adapter):
     content, media_type, headers = await mock_adapter.fetch_binary("/camera/last")
     assert len(content) > 0
     assert media_type == "image/png"
+    assert isinstance(headers, httpx.Headers)
     assert headers["content-type"] == "image/png"
-    assert "last-modified" in headers
+    assert headers["Content-Type"] == "image/png"
+    assert "Last-Modified" in headers
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,85 @@
+"""Tests for the SSE subscription manager."""
+
+import pytest
+
+from pc_client.api.sse_manager import SseManager
+
+
+@pytest.mark.asyncio
+async def test_publish_fans_out_to_subscribers():
+    manager = SseManager()
+    first = manager.subscribe()
+    second = manager.subscribe()
+
+    manager.publish({"topic": "cmd.move"})
+
+    assert (await first.get())["topic"] == "cmd.move"
+    assert (await second.get())["topic"] == "cmd.move"
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_oldest_event_and_keeps_subscriber():
+    manager = SseManager(queue_size=2)
+    queue = manager.subscribe()
+
+    for idx in range(3):
+        manager.publish({"topic": "tick", "data": idx})
+
+    assert manager.subscriber_count() == 1
+    assert queue.qsize() == 2
+    assert [(await queue.get())["data"] for _ in range(2)] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_preloads_backlog_up_to_queue_size():
+    manager = SseManager(queue_size=2)
+    for idx in range(5):
+        manager.publish({"topic": "tick", "data": idx})
+
+    queue = manager.subscribe()
+
+    assert queue.qsize() == 2
+
+
+@pytest.mark.asyncio
+async def test_transient_publish_skips_backlog():
+    manager = SseManager()
+    queue = manager.subscribe()
+
+    manager.publish({"topic": "heartbeat"}, retain=False)
+
+    assert (await queue.get())["topic"] == "heartbeat"
+    assert manager.backlog() == ()
+
+
+@pytest.mark.asyncio
+async def test_background_fanout_defers_delivery_but_not_backlog():
+    manager = SseManager()
+    manager.start()
+    try:
+        queue = manager.subscribe()
+        manager.publish({"topic": "cmd.stop"})
+
+        assert [event["topic"] for event in manager.backlog()] == ["cmd.stop"]
+        assert queue.empty()
+        late = manager.subscribe()
+        assert late.empty()
+
+        assert (await queue.get())["topic"] == "cmd.stop"
+        assert (await late.get())["topic"] == "cmd.stop"
+    finally:
+        await manager.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_events():
+    manager = SseManager()
+    manager.start()
+    queue = manager.subscribe()
+    manager.publish({"topic": "navigator.stop"})
+
+    await manager.stop()
+
+    assert queue.get_nowait()["topic"] == "navigator.stop"
+    manager.publish({"topic": "inline"})
+    assert queue.get_nowait()["topic"] == "inline"
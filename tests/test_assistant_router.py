@@ -1,5 +1,9 @@
 """Tests for Google Assistant service and router."""
 
+import asyncio
+import os
+import threading
+
 import pytest
 from pathlib import Path
 
@@ -8,6 +12,7 @@ from fastapi.testclient import TestClient
 from pc_client.api.server import create_app
 from pc_client.cache import CacheManager
 from pc_client.config import Settings
+from pc_client.services import google_assistant
 from pc_client.services.google_assistant import GoogleAssistantService, AssistantDevice
 
 
@@ -169,6 +174,58 @@ off_command = "Turn off Light One"
         assert status["test_mode"] is True
         assert "devices_count" in status
 
+    @pytest.mark.asyncio
+    async def test_live_command_runs_off_event_loop(self, tmp_path, monkeypatch):
+        """Blocking live round trips run in a worker thread."""
+        monkeypatch.setattr(google_assistant, "GOOGLE_ASSISTANT_SDK_AVAILABLE", True)
+        service = GoogleAssistantService(config_path=str(tmp_path / "devices.toml"), enabled=False)
+        threads = []
+
+        def fake_live(command_text):
+            threads.append(threading.get_ident())
+            return {"ok": True, "command": command_text, "mode": "live"}
+
+        monkeypatch.setattr(service, "_execute_live_command", fake_live)
+        result = await service._execute_command("Turn on Lamp")
+
+        assert result["command"] == "Turn on Lamp"
+        assert threads and threads[0] != threading.get_ident()
+
+    def test_live_lock_created_on_the_running_loop(self, tmp_path, monkeypatch):
+        """The live-command lock is created by the loop that uses it, not at construction."""
+        monkeypatch.setattr(google_assistant, "GOOGLE_ASSISTANT_SDK_AVAILABLE", True)
+        service = GoogleAssistantService(config_path=str(tmp_path / "devices.toml"), enabled=False)
+        monkeypatch.setattr(service, "_execute_live_command", lambda text: {"ok": True, "command": text})
+        assert service._live_lock is None
+
+        async def contended():
+            return await asyncio.gather(service._execute_command("a"), service._execute_command("b"))
+
+        results = asyncio.run(contended())
+        assert [r["command"] for r in results] == ["a", "b"]
+        assert service._live_lock is not None
+
+    def test_tokens_file_parsed_only_when_changed(self, tmp_path):
+        """Token file is re-read only after its mtime changes."""
+        tokens = tmp_path / "tokens.json"
+        tokens.write_text('{"refresh_token": "a"}')
+        service = GoogleAssistantService(
+            config_path=str(tmp_path / "devices.toml"),
+            enabled=False,
+            tokens_path=str(tokens),
+        )
+
+        first = service._load_tokens_from_file()
+        assert first == {"refresh_token": "a"}
+        assert service._load_tokens_from_file() is first
+
+        tokens.write_text('{"refresh_token": "b"}')
+        os.utime(tokens, (1, 1))
+        assert service._load_tokens_from_file() == {"refresh_token": "b"}
+
+        tokens.unlink()
+        assert service._load_tokens_from_file() is None
+
 
 class TestAssistantDevice:
     """Tests for AssistantDevice dataclass."""
@@ -1,5 +1,8 @@
 """Tests for Google Home router endpoints."""
 
+import asyncio
+
+import httpx
 from fastapi.testclient import TestClient
 
 from pc_client.api.server import create_app
@@ -51,3 +54,220 @@ def test_home_auth_endpoint(tmp_path):
     resp = client.post("/api/home/auth")
     assert resp.status_code == 200
     assert resp.json()["ok"] is True
+
+
+def test_home_command_index_follows_device_list_reassignment(tmp_path):
+    client = make_client(tmp_path)
+    cmd = {"deviceId": "devices/light/new", "command": "action.devices.commands.OnOff", "params": {"on": True}}
+    assert client.post("/api/home/command", json=cmd).status_code == 400
+
+    client.app.state.home_devices = [{"name": "devices/light/new", "traits": {}}]
+    resp = client.post("/api/home/command", json=cmd)
+    assert resp.status_code == 200
+    assert client.app.state.home_devices[0]["traits"]["sdm.devices.traits.OnOff"] == {"on": True}
+
+
+def test_home_command_dispatch_updates_traits(tmp_path):
+    client = make_client(tmp_path)
+    vacuum = "devices/vacuum/dusty"
+    for command, params in (
+        ("action.devices.commands.StartStop", {"start": True}),
+        ("action.devices.commands.PauseUnpause", {"pause": True}),
+        ("action.devices.commands.Dock", {}),
+        ("action.devices.commands.Unknown", {}),
+    ):
+        resp = client.post("/api/home/command", json={"deviceId": vacuum, "command": command, "params": params})
+        assert resp.status_code == 200
+
+    device = next(d for d in client.get("/api/home/devices").json()["devices"] if d["name"] == vacuum)
+    assert device["traits"]["sdm.devices.traits.StartStop"] == {"isRunning": True, "isPaused": True}
+    assert "lastDockTs" in device["traits"]["sdm.devices.traits.Dock"]
+
+
+def test_home_devices_default_payload_is_copied_on_first_command(tmp_path):
+    client = make_client(tmp_path)
+    del client.app.state.home_devices
+    before = client.get("/api/home/devices").json()
+    assert not hasattr(client.app.state, "home_devices")
+
+    cmd = {"deviceId": "devices/light/living-room", "command": "action.devices.commands.OnOff", "params": {"on": False}}
+    assert client.post("/api/home/command", json=cmd).status_code == 200
+    light = client.get("/api/home/devices").json()["devices"][0]
+    assert light["traits"]["sdm.devices.traits.OnOff"] == {"on": False}
+
+    del client.app.state.home_devices
+    assert client.get("/api/home/devices").json() == before
+
+
+def test_home_adapter_calls_are_bounded_by_timeouts(tmp_path):
+    class SlowAdapter:
+        async def get_home_status(self):
+            await asyncio.sleep(1)
+            return {"authenticated": False}
+
+        async def post_home_command(self, payload):
+            await asyncio.sleep(1)
+            return {"ok": True}
+
+    client = make_client(tmp_path)
+    settings = client.app.state.settings
+    settings.home_status_timeout_seconds = 0.01
+    settings.home_command_timeout_seconds = 0.01
+    client.app.state.rest_adapter = SlowAdapter()
+
+    assert client.get("/api/home/status").json()["authenticated"] is True
+    resp = client.post("/api/home/command", json={"deviceId": "devices/vacuum/dusty"})
+    assert resp.status_code == 504
+    assert resp.json() == {"ok": False, "error": "upstream_timeout"}
+
+
+def test_home_status_reuses_upstream_response_until_a_write(tmp_path):
+    calls = []
+
+    class CountingAdapter:
+        async def get_home_status(self):
+            calls.append("status")
+            return {"authenticated": True, "profile": {"email": f"user{len(calls)}@mock.local"}}
+
+        async def post_home_auth(self):
+            return {"ok": True}
+
+    client = make_client(tmp_path)
+    client.app.state.rest_adapter = CountingAdapter()
+
+    first = client.get("/api/home/status").json()
+    assert client.get("/api/home/status").json() == first
+    assert calls == ["status"]
+
+    assert client.post("/api/home/auth").status_code == 200
+    assert client.get("/api/home/status").json()["profile"]["email"] == "user2@mock.local"
+    assert calls == ["status", "status"]
+
+
+def test_home_devices_body_is_reencoded_only_after_changes(tmp_path):
+    client = make_client(tmp_path)
+    state = client.app.state
+    client.get("/api/home/devices")
+    body = state.home_devices_body
+    client.get("/api/home/devices")
+    assert state.home_devices_body is body
+
+    cmd = {"deviceId": "devices/light/workbench", "command": "action.devices.commands.OnOff", "params": {"on": False}}
+    client.post("/api/home/command", json=cmd)
+    light = client.get("/api/home/devices").json()["devices"][0]
+    assert light["traits"]["sdm.devices.traits.OnOff"] == {"on": False}
+
+    state.home_devices = [{"name": "devices/light/other", "traits": {}}]
+    assert client.get("/api/home/devices").json()["devices"] == state.home_devices
+
+
+def test_home_command_forwards_only_sent_fields(tmp_path):
+    forwarded = []
+
+    class RecordingAdapter:
+        async def post_home_command(self, payload):
+            forwarded.append(payload)
+            return {"ok": True}
+
+    client = make_client(tmp_path)
+    client.app.state.rest_adapter = RecordingAdapter()
+
+    resp = client.post("/api/home/command", json={"deviceId": "devices/vacuum/dusty", "command": "x", "extra": 1})
+    assert resp.status_code == 200
+    assert forwarded == [{"deviceId": "devices/vacuum/dusty", "command": "x"}]
+    assert client.post("/api/home/command", json={"deviceId": 5}).status_code == 422
+
+
+def test_home_status_default_is_copied_before_auth(tmp_path):
+    client = make_client(tmp_path)
+    del client.app.state.home_state
+    assert client.get("/api/home/status").json()["authenticated"] is False
+    assert not hasattr(client.app.state, "home_state")
+
+    assert client.post("/api/home/auth").status_code == 200
+    assert client.get("/api/home/status").json()["authenticated"] is True
+
+    del client.app.state.home_state
+    assert client.get("/api/home/status").json()["authenticated"] is False
+
+
+def test_home_endpoints_follow_rest_adapter_replacement(tmp_path):
+    class RemoteAdapter:
+        async def post_home_auth(self):
+            return {"ok": True, "note": "remote"}
+
+    client = make_client(tmp_path)
+    client.app.state.rest_adapter = RemoteAdapter()
+    assert client.post("/api/home/auth").json()["note"] == "remote"
+
+    client.app.state.rest_adapter = None
+    assert client.post("/api/home/auth").json()["note"] == "local mock auth"
+
+
+async def test_concurrent_home_device_reads_share_one_upstream_call(tmp_path):
+    calls = []
+    release = asyncio.Event()
+
+    class GatedAdapter:
+        async def get_home_devices(self):
+            calls.append("devices")
+            await release.wait()
+            return {"ok": True, "devices": [{"name": "devices/light/remote", "traits": {}}]}
+
+    app = make_client(tmp_path).app
+    app.state.rest_adapter = GatedAdapter()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        pending = [asyncio.ensure_future(client.get("/api/home/devices")) for _ in range(5)]
+        while not calls:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        release.set()
+        responses = await asyncio.gather(*pending)
+
+    assert calls == ["devices"]
+    assert {resp.json()["devices"][0]["name"] for resp in responses} == {"devices/light/remote"}
+    assert app.state.home_inflight_reads == {}
+
+
+async def test_home_read_during_command_is_not_served_after_the_write(tmp_path):
+    upstream = {"on": True}
+    command_started = asyncio.Event()
+    release = asyncio.Event()
+    reads = []
+
+    class GatedAdapter:
+        async def get_home_devices(self):
+            reads.append(dict(upstream))
+            return {"ok": True, "devices": [{"name": "devices/light", "traits": {"on": upstream["on"]}}]}
+
+        async def post_home_command(self, payload):
+            command_started.set()
+            await release.wait()
+            upstream["on"] = payload["params"]["on"]
+            return {"ok": True}
+
+    app = make_client(tmp_path).app
+    app.state.rest_adapter = GatedAdapter()
+    transport = httpx.ASGITransport(app=app)
+    cmd = {"deviceId": "devices/light", "command": "action.devices.commands.OnOff", "params": {"on": False}}
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        command = asyncio.ensure_future(client.post("/api/home/command", json=cmd))
+        await command_started.wait()
+        # This read starts after the pre-write invalidation and sees the pre-write state
+        during = await client.get("/api/home/devices")
+        assert during.json()["devices"][0]["traits"]["on"] is True
+        release.set()
+        assert (await command).status_code == 200
+
+        after = await client.get("/api/home/devices")
+
+    assert after.json()["devices"][0]["traits"]["on"] is False
+    assert reads == [{"on": True}, {"on": False}]
+
+
+def test_home_read_endpoints_allow_short_client_caching(tmp_path):
+    client = make_client(tmp_path)
+    for path in ("/api/home/status", "/api/home/devices"):
+        assert client.get(path).headers["cache-control"] == "private, max-age=2, stale-while-revalidate=10"
+    assert "cache-control" not in client.post("/api/home/auth").headers
@@ -34,3 +34,59 @@ def test_logic_features_local_fallback():
     assert payload["ok"] is True
     assert isinstance(payload["features"], list)
     assert any(feature["name"] == "s3_follow_me_face" for feature in payload["features"])
+
+
+def test_control_state_local_snapshot_tracks_mutations():
+    client = make_client()
+    first = client.get("/api/control/state")
+    assert first.status_code == 200
+    assert first.headers["content-type"] == "application/json"
+    payload = first.json()
+    assert payload["navigator"]["active"] is False
+    assert isinstance(payload["updated_at"], float)
+
+    client.post("/api/navigator/start", json={"strategy": "explore"})
+    payload = client.get("/api/control/state").json()
+    assert payload["navigator"] == {"active": True, "strategy": "explore", "state": "navigating"}
+    assert set(payload) == {"tracking", "navigator", "camera", "updated_at"}
+
+
+def test_feature_toggle_local_fallback_dispatch():
+    client = make_client()
+    resp = client.post("/api/logic/feature/recon", json={"enabled": True})
+    assert resp.status_code == 200
+    assert resp.json()["result"]["active"] is True
+
+    resp = client.post("/api/logic/feature/face_tracking", json={"enabled": True})
+    assert resp.status_code == 200
+    assert resp.json()["result"] == {"ok": True, "mode": "face", "enabled": True}
+
+
+def test_feature_toggle_unknown_feature_returns_404():
+    client = make_client()
+    resp = client.post("/api/logic/feature/warp_drive", json={"enabled": True})
+    assert resp.status_code == 404
+    assert resp.json() == {"ok": False, "error": "unknown_feature", "feature": "warp_drive"}
+
+
+class _FakeAdapter:
+    async def get_logic_summary(self):
+        return {"ok": True, "summary": {"source": "rider-pi"}}
+
+    async def get_motion_queue(self):
+        return {"error": "queue offline"}
+
+    async def get_resource(self, name):
+        raise RuntimeError("connection refused")
+
+
+def test_remote_payload_preferred_and_errors_fall_back_locally():
+    client = make_client()
+    client.app.state.rest_adapter = _FakeAdapter()
+
+    assert client.get("/api/logic/summary").json() == {"ok": True, "summary": {"source": "rider-pi"}}
+    assert client.get("/api/motion/queue").json() == {"items": []}
+
+    resource = client.get("/api/resource/mic").json()
+    assert resource["name"] == "mic"
+    assert resource["error"] == "connection refused"
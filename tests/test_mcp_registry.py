@@ -4,7 +4,7 @@ Testy rejestracji narzędzi, walidacji i wywoływania handlerów.
 """
 
 import pytest
-from pc_client.mcp.registry import Tool, ToolRegistry, ToolInvokeResult
+from pc_client.mcp.registry import Tool, ToolErrorCode, ToolRegistry, ToolInvokeResult
 
 
 class TestToolRegistry:
@@ -74,6 +74,17 @@ class TestToolRegistry:
         registry.clear()
         assert len(registry.list_tools()) == 0
 
+    def test_version_tracks_tool_set_changes(self, registry):
+        """Test that version changes on register/unregister/clear only."""
+        start = registry.version
+        registry.register(Tool(name="test.tool", description="A test tool"))
+        assert registry.version == start + 1
+        registry.unregister("missing.tool")
+        assert registry.version == start + 1
+        registry.unregister("test.tool")
+        registry.clear()
+        assert registry.version == start + 3
+
     def test_get_stats(self, registry):
         """Test getting registry stats."""
         tool = Tool(name="test.tool", description="A test tool")
@@ -140,12 +151,38 @@ class TestToolInvocation:
         assert result.ok is True
         assert result.result == {"async": True}
 
+    @pytest.mark.asyncio
+    async def test_invoke_follows_handler_replaced_after_register(self, registry):
+        """Test that swapping a tool's handler to async after registration is honoured."""
+        tool = Tool(name="test.swap", description="Swap", handler=lambda: {"sync": True})
+        registry.register(tool)
+        assert (await registry.invoke("test.swap")).result == {"sync": True}
+
+        async def async_handler():
+            return {"async": True}
+
+        tool.handler = async_handler
+        assert (await registry.invoke("test.swap")).result == {"async": True}
+
     @pytest.mark.asyncio
     async def test_invoke_nonexistent_tool(self, registry):
         """Test invoking a nonexistent tool."""
         result = await registry.invoke("nonexistent")
         assert result.ok is False
         assert "not found" in result.error
+        assert result.error_code is ToolErrorCode.NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_invoke_does_not_resolve_hostname_per_call(self, registry, monkeypatch):
+        """Test that the host in result meta is resolved once per registry."""
+        import socket
+
+        def fail():
+            raise AssertionError("gethostname called on invoke")
+
+        monkeypatch.setattr(socket, "gethostname", fail)
+        result = await registry.invoke("nonexistent")
+        assert result.meta["host"] == registry._hostname
 
     @pytest.mark.asyncio
     async def test_invoke_tool_without_handler(self, registry):
@@ -225,6 +262,20 @@ class TestToolInvocation:
         result = await registry.invoke("test.fail")
         assert result.ok is False
         assert "Something went wrong" in result.error
+        assert result.error_code is ToolErrorCode.INVALID
+
+    @pytest.mark.asyncio
+    async def test_invoke_handler_missing_key_is_not_found(self, registry):
+        """Test that KeyError from a handler is reported as a missing resource."""
+
+        def failing_handler():
+            raise KeyError("device-1")
+
+        registry.register(Tool(name="test.lookup", description="Lookup tool", handler=failing_handler))
+
+        result = await registry.invoke("test.lookup")
+        assert result.ok is False
+        assert result.error_code is ToolErrorCode.NOT_FOUND
 
 
 class TestToolInvokeResult:
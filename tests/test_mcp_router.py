@@ -104,6 +104,23 @@ class TestListToolsEndpoint:
                 assert "args_schema" in tool
                 assert "permissions" in tool
 
+    @pytest.mark.asyncio
+    async def test_list_tools_etag_and_refresh(self, app, clean_registry):
+        """Test that unchanged tool lists answer 304 and new tools refresh the ETag."""
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            first = await client.get("/api/mcp/tools")
+            etag = first.headers["etag"]
+
+            cached = await client.get("/api/mcp/tools", headers={"If-None-Match": etag})
+            assert cached.status_code == 304
+            assert cached.content == b""
+
+            clean_registry.register(Tool(name="test.etag_tool", description="ETag test"))
+            refreshed = await client.get("/api/mcp/tools", headers={"If-None-Match": etag})
+            assert refreshed.status_code == 200
+            assert refreshed.headers["etag"] != etag
+            assert refreshed.json()["count"] == first.json()["count"] + 1
+
 
 class TestGetResourcesEndpoint:
     """Tests for GET /api/mcp/resources endpoint."""
@@ -240,6 +257,32 @@ class TestInvokeToolEndpoint:
             assert "temperature" in data["result"]
             assert "location" in data["result"]
 
+    @pytest.mark.asyncio
+    async def test_invoke_handler_error_mentioning_not_found_is_400(self, app, clean_registry):
+        """Test that a handler error is not a 404 just because its message says "not found"."""
+
+        def failing_handler():
+            raise ValueError("user not found")
+
+        clean_registry.register(Tool(name="test.bad_value", description="Fails", handler=failing_handler))
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/api/mcp/tools/invoke", json={"tool": "test.bad_value"})
+            assert response.status_code == 400
+            assert response.json()["error"] == "user not found"
+
+    @pytest.mark.asyncio
+    async def test_invoke_handler_missing_resource_is_404(self, app, clean_registry):
+        """Test that FileNotFoundError from a handler maps to 404."""
+
+        def failing_handler():
+            raise FileNotFoundError("config not found")
+
+        clean_registry.register(Tool(name="test.missing_file", description="Fails", handler=failing_handler))
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/api/mcp/tools/invoke", json={"tool": "test.missing_file"})
+            assert response.status_code == 404
+            assert response.json()["error"] == "config not found"
+
     @pytest.mark.asyncio
     async def test_invoke_returns_meta(self, app):
         """Test that invoke returns meta information."""
@@ -250,6 +293,18 @@ class TestInvokeToolEndpoint:
             assert "duration_ms" in data["meta"]
             assert "host" in data["meta"]
 
+    def test_invoke_log_is_written_off_the_request_path(self):
+        """Test that mcp-tools.log records are queued for a background writer."""
+        import logging.handlers
+
+        mcp_router._setup_mcp_file_logger()
+        handlers = list(mcp_router.mcp_file_logger.handlers)
+        assert sum(isinstance(h, logging.handlers.QueueHandler) for h in handlers) == 1
+        assert mcp_router._mcp_log_listener is not None
+
+        mcp_router._setup_mcp_file_logger()
+        assert mcp_router.mcp_file_logger.handlers == handlers
+
 
 class TestStatsEndpoint:
     """Tests for GET /api/mcp/stats endpoint."""
@@ -264,6 +319,14 @@ class TestStatsEndpoint:
             assert data["ok"] is True
             assert "stats" in data
 
+    @pytest.mark.asyncio
+    async def test_polled_endpoints_send_cache_control(self, app):
+        """Test that stats and resources allow short client-side caching."""
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            for path in ("/api/mcp/stats", "/api/mcp/resources"):
+                response = await client.get(path)
+                assert response.headers["cache-control"] == "private, max-age=2, stale-while-revalidate=10"
+
     @pytest.mark.asyncio
     async def test_get_stats_structure(self, app):
         """Test that stats have correct structure."""
@@ -333,3 +396,52 @@ class TestHistoryEndpoint:
             data = response.json()
             assert "log_path" in data
             assert "mcp-tools.log" in data["log_path"]
+
+    @pytest.mark.asyncio
+    async def test_get_history_missing_log(self, app, tmp_path, monkeypatch):
+        """Test that a missing log file yields an empty history, looked up in the current directory."""
+        monkeypatch.chdir(tmp_path)
+        missing = str(tmp_path / "logs" / "mcp-tools.log")
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/api/mcp/history")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["history"] == []
+        assert data["count"] == 0
+        assert data["log_path"] == missing
+
+
+class TestReadLastLines:
+    """Tests for the reverse log reader used by /history."""
+
+    def _expected(self, path, n, max_len):
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            lines = [line.strip() for line in f.read().split("\n")]
+        lines = [line if len(line) <= max_len else line[:max_len] + "..." for line in lines if line]
+        return lines[-n:]
+
+    @pytest.mark.parametrize("num_lines", [1, 7, 50, 5000])
+    def test_matches_forward_read(self, tmp_path, num_lines):
+        """Test that the tail equals the last lines of a forward read."""
+        path = tmp_path / "mcp-tools.log"
+        rows = [f"2025-01-01 [INFO] INVOKE tool.{i} -> SUCCESS ({i}ms)" for i in range(3000)]
+        rows[2990] = "x" * 3000
+        rows[2995] = ""
+        path.write_bytes(("\r\n".join(rows) + "\n\n").encode())
+
+        result = mcp_router._read_last_lines(str(path), num_lines)
+        assert result == self._expected(path, num_lines, 1024)
+
+    def test_empty_file(self, tmp_path):
+        """Test that an empty file yields no lines."""
+        path = tmp_path / "empty.log"
+        path.write_bytes(b"")
+        assert mcp_router._read_last_lines(str(path), 10) == []
+
+    def test_invalid_utf8_stays_on_its_line(self, tmp_path):
+        """Test that undecodable bytes are replaced without merging neighbouring lines."""
+        path = tmp_path / "mcp-tools.log"
+        path.write_bytes("zażółć\n".encode() + b"bad \xc5\n" + b"\xe2\x82\nlast\n")
+
+        result = mcp_router._read_last_lines(str(path), 3)
+        assert result == ["bad �", "�", "last"]
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import time
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 from pc_client.core.model_manager import ModelManager, ModelInfo, ActiveModels
@@ -139,6 +140,58 @@ class TestModelManager:
         assert "yolov8n" in names
         assert "whisper-base" in names
 
+    def test_scan_local_models_matches_os_walk(self, tmp_path):
+        """Test that the scandir walk finds the same files as os.walk, with sizes."""
+        models_dir = tmp_path / "models"
+        (models_dir / "vision" / "nested").mkdir(parents=True)
+        (models_dir / "voice").mkdir()
+        (models_dir / "top.gguf").write_bytes(b"x" * 2048)
+        (models_dir / "vision" / "yolov8n.PT").write_bytes(b"x" * 1024)
+        (models_dir / "vision" / "nested" / "deep.tflite").write_bytes(b"x")
+        (models_dir / "voice" / "piper.onnx").write_bytes(b"x" * 4096)
+        (models_dir / "voice" / "notes.md").write_text("skip")
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "linked.pt").write_bytes(b"x")
+        os.symlink(outside, models_dir / "link")
+
+        manager = ModelManager(models_dir=str(models_dir))
+        result = manager.scan_local_models()
+
+        expected = [
+            os.path.relpath(os.path.join(root, f), models_dir)
+            for root, _, files in os.walk(models_dir)
+            for f in files
+            if Path(f).suffix.lower() in ModelManager.MODEL_EXTENSIONS
+        ]
+        assert [m.path for m in result] == expected
+        sizes = {m.name: m.size_mb for m in result}
+        assert sizes["top"] == 2048 / (1024 * 1024)
+        assert sizes["piper"] == 4096 / (1024 * 1024)
+
+    def test_concurrent_scans_do_not_interleave(self, tmp_path):
+        """Test that scans running in parallel threads each publish a complete, duplicate-free inventory."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        models_dir = tmp_path / "models"
+        models_dir.mkdir()
+        for i in range(400):
+            (models_dir / f"model{i}.onnx").write_bytes(b"x")
+
+        manager = ModelManager(models_dir=str(models_dir))
+        create_model_info = manager._create_model_info
+
+        def yielding_create_model_info(*args, **kwargs):
+            time.sleep(0)  # let the other scan thread run mid-scan
+            return create_model_info(*args, **kwargs)
+
+        with patch.object(manager, "_create_model_info", yielding_create_model_info):
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                for _ in range(5):
+                    results = list(executor.map(lambda _: manager.scan_local_models(), range(2)))
+                    assert [len(r) for r in results] == [400, 400]
+                    assert len(manager.get_installed_models()) == 400
+
     def test_get_active_models_missing_config(self, tmp_path):
         """Test reading config when file doesn't exist."""
         manager = ModelManager(providers_config_path=str(tmp_path / "nonexistent.toml"))
@@ -214,6 +267,58 @@ ollama_host = "http://localhost:11434"
         assert isinstance(result["ollama"], list)
         assert isinstance(result["active"], dict)
 
+    async def test_scan_ollama_backs_off_after_connection_failure(self, tmp_path, monkeypatch):
+        """Test that an unreachable Ollama is not re-queried until its back-off expires."""
+        monkeypatch.delenv("TEST_MODE", raising=False)
+        attempts = []
+        reachable = False
+
+        class FakeResponse:
+            status_code = 200
+
+            def json(self):
+                return {"models": [{"name": "llama3.2:1b"}]}
+
+        class FakeClient:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def get(self, url):
+                attempts.append(url)
+                if not reachable:
+                    raise ConnectionError("connection refused")
+                return FakeResponse()
+
+        now = [1000.0]
+        manager = ModelManager(models_dir=str(tmp_path), providers_config_path=str(tmp_path / "missing.toml"))
+        with patch("httpx.AsyncClient", FakeClient), patch("time.monotonic", lambda: now[0]):
+            assert await manager.scan_ollama_models() == []
+            assert await manager.scan_ollama_models() == []
+            assert len(attempts) == 1
+
+            # Back-off doubles after each failure: 2 s, then 4 s
+            now[0] += 2.0
+            await manager.scan_ollama_models()
+            assert len(attempts) == 2
+            now[0] += 2.0
+            await manager.scan_ollama_models()
+            assert len(attempts) == 2
+
+            now[0] += 2.0
+            reachable = True
+            assert await manager.scan_ollama_models() == [{"name": "llama3.2:1b"}]
+            assert len(attempts) == 3
+
+            # A successful query clears the back-off
+            await manager.scan_ollama_models()
+            assert len(attempts) == 4
+
 
 class TestPersistActiveModel:
     """Tests for persist_active_model method."""
@@ -1,9 +1,12 @@
 """Tests for model_router.py API endpoints."""
 
+import time
+
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from starlette.datastructures import State
 
 from pc_client.api.routers.model_router import router, _fetch_remote_models, _switch_provider_mode
 from pc_client.core.model_manager import ModelManager, ActiveModels
@@ -24,6 +27,14 @@ def client(app):
     return TestClient(app)
 
 
+@pytest.fixture
+def mock_request():
+    """Request stub with a fresh app state, so no cached Rider-PI inventory leaks between tests."""
+    request = MagicMock()
+    request.app.state = State()
+    return request
+
+
 class TestGetInstalledModels:
     """Tests for GET /api/models/installed endpoint."""
 
@@ -66,6 +77,76 @@ class TestGetInstalledModels:
         assert data["total_local"] == 1
         assert data["local"][0]["name"] == "yolov8n"
 
+    def test_scans_sources_concurrently(self, app, client):
+        """Test that the Ollama scan and the Rider-PI fetch overlap instead of running in sequence."""
+        import asyncio
+
+        remote_started = asyncio.Event()
+        overlapped = []
+
+        async def ollama_waits_for_remote(self, *args, **kwargs):
+            await asyncio.wait_for(remote_started.wait(), timeout=2)
+            overlapped.append(True)
+            return []
+
+        async def remote_models():
+            remote_started.set()
+            return {"models": [{"name": "pi-model"}]}
+
+        adapter = MagicMock()
+        adapter.get_remote_models = remote_models
+        app.state.rest_adapter = adapter
+
+        with patch.object(ModelManager, "scan_local_models", return_value=[]):
+            with patch.object(ModelManager, "scan_ollama_models", ollama_waits_for_remote):
+                response = client.get("/api/models/installed")
+
+        assert response.status_code == 200
+        assert response.json()["remote"] == [{"name": "pi-model"}]
+        assert overlapped == [True]
+
+    def test_scans_share_one_config_load(self, app, client, tmp_path, monkeypatch):
+        """Test that the local and Ollama scans reuse one config load instead of reloading it concurrently."""
+        # Default models dir (relative data/models) so the scan also looks up configured models
+        (tmp_path / "data" / "models").mkdir(parents=True)
+        monkeypatch.chdir(tmp_path)
+        config_path = tmp_path / "providers.toml"
+        config_path.write_text('[vision]\ndetection_model = "yolov8n"\n[text]\nollama_host = "http://ollama.test"\n')
+        manager = ModelManager(providers_config_path=str(config_path))
+        app.state.model_manager = manager
+
+        loads = []
+        get_active_models = manager.get_active_models
+
+        def counting_get_active_models():
+            loads.append(True)
+            time.sleep(0.05)  # widen the window in which a concurrent scan could reload the config
+            return get_active_models()
+
+        hosts = []
+
+        class UnreachableClient:
+            def __init__(self, *args, **kwargs):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def get(self, url):
+                hosts.append(url)
+                raise ConnectionError("offline")
+
+        with patch.object(manager, "get_active_models", counting_get_active_models):
+            with patch("httpx.AsyncClient", UnreachableClient):
+                response = client.get("/api/models/installed")
+
+        assert response.status_code == 200
+        assert loads == [True]
+        assert hosts == ["http://ollama.test/api/tags"]
+
 
 class TestGetActiveModels:
     """Tests for GET /api/models/active endpoint."""
@@ -115,8 +196,9 @@ class TestBindModel:
         )
 
         assert response.status_code == 400
+        assert response.headers["content-type"] == "application/json"
         data = response.json()
-        assert "error" in data
+        assert data["error"] == "Invalid slot. Must be one of: ['text', 'vision', 'voice_asr', 'voice_tts']"
 
     def test_bind_model_missing_provider(self, client):
         """Test binding without provider returns error."""
@@ -191,19 +273,15 @@ class TestFetchRemoteModels:
     """Tests for _fetch_remote_models helper function."""
 
     @pytest.mark.asyncio
-    async def test_returns_empty_when_no_adapter(self):
+    async def test_returns_empty_when_no_adapter(self, mock_request):
         """Test returns empty list when rest_adapter is not available."""
-        mock_request = MagicMock()
-        mock_request.app.state = MagicMock(spec=[])  # No rest_adapter attribute
-
         result = await _fetch_remote_models(mock_request)
 
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_returns_empty_when_adapter_is_none(self):
+    async def test_returns_empty_when_adapter_is_none(self, mock_request):
         """Test returns empty list when rest_adapter is None."""
-        mock_request = MagicMock()
         mock_request.app.state.rest_adapter = None
 
         result = await _fetch_remote_models(mock_request)
@@ -211,11 +289,10 @@ class TestFetchRemoteModels:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_returns_models_from_models_key(self):
+    async def test_returns_models_from_models_key(self, mock_request):
         """Test returns models from 'models' key in response."""
         mock_adapter = MagicMock()
         mock_adapter.get_remote_models = AsyncMock(return_value={"models": [{"name": "yolov8n", "category": "vision"}]})
-        mock_request = MagicMock()
         mock_request.app.state.rest_adapter = mock_adapter
 
         result = await _fetch_remote_models(mock_request)
@@ -224,13 +301,12 @@ class TestFetchRemoteModels:
         assert result[0]["name"] == "yolov8n"
 
     @pytest.mark.asyncio
-    async def test_returns_models_from_local_key_for_backward_compat(self):
+    async def test_returns_models_from_local_key_for_backward_compat(self, mock_request):
         """Test returns models from 'local' key for backward compatibility."""
         mock_adapter = MagicMock()
         mock_adapter.get_remote_models = AsyncMock(
             return_value={"local": [{"name": "whisper-base", "category": "voice_asr"}]}
         )
-        mock_request = MagicMock()
         mock_request.app.state.rest_adapter = mock_adapter
 
         result = await _fetch_remote_models(mock_request)
@@ -239,7 +315,7 @@ class TestFetchRemoteModels:
         assert result[0]["name"] == "whisper-base"
 
     @pytest.mark.asyncio
-    async def test_prefers_models_key_over_local(self):
+    async def test_prefers_models_key_over_local(self, mock_request):
         """Test prefers 'models' key over 'local' when both present."""
         mock_adapter = MagicMock()
         mock_adapter.get_remote_models = AsyncMock(
@@ -248,7 +324,6 @@ class TestFetchRemoteModels:
                 "local": [{"name": "old-format"}],
             }
         )
-        mock_request = MagicMock()
         mock_request.app.state.rest_adapter = mock_adapter
 
         result = await _fetch_remote_models(mock_request)
@@ -257,11 +332,10 @@ class TestFetchRemoteModels:
         assert result[0]["name"] == "new-format"
 
     @pytest.mark.asyncio
-    async def test_returns_empty_on_network_error(self):
+    async def test_returns_empty_on_network_error(self, mock_request):
         """Test returns empty list when network error occurs."""
         mock_adapter = MagicMock()
         mock_adapter.get_remote_models = AsyncMock(side_effect=ConnectionError("Network unreachable"))
-        mock_request = MagicMock()
         mock_request.app.state.rest_adapter = mock_adapter
 
         result = await _fetch_remote_models(mock_request)
@@ -269,11 +343,10 @@ class TestFetchRemoteModels:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_returns_empty_on_invalid_payload(self):
+    async def test_returns_empty_on_invalid_payload(self, mock_request):
         """Test returns empty list when payload is not a dict."""
         mock_adapter = MagicMock()
         mock_adapter.get_remote_models = AsyncMock(return_value="invalid")
-        mock_request = MagicMock()
         mock_request.app.state.rest_adapter = mock_adapter
 
         result = await _fetch_remote_models(mock_request)
@@ -281,11 +354,10 @@ class TestFetchRemoteModels:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_returns_empty_on_missing_keys(self):
+    async def test_returns_empty_on_missing_keys(self, mock_request):
         """Test returns empty list when neither models nor local keys present."""
         mock_adapter = MagicMock()
         mock_adapter.get_remote_models = AsyncMock(return_value={"other": []})
-        mock_request = MagicMock()
         mock_request.app.state.rest_adapter = mock_adapter
 
         result = await _fetch_remote_models(mock_request)
@@ -293,17 +365,62 @@ class TestFetchRemoteModels:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_returns_empty_when_models_not_list(self):
+    async def test_returns_empty_when_models_not_list(self, mock_request):
         """Test returns empty list when models value is not a list."""
         mock_adapter = MagicMock()
         mock_adapter.get_remote_models = AsyncMock(return_value={"models": "not-a-list"})
-        mock_request = MagicMock()
         mock_request.app.state.rest_adapter = mock_adapter
 
         result = await _fetch_remote_models(mock_request)
 
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_reuses_inventory_within_ttl_and_shares_inflight_fetch(self, mock_request):
+        """Test that concurrent and repeated calls share one Rider-PI request until the TTL expires."""
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def slow_remote():
+            await release.wait()
+            return {"models": [{"name": "yolov8n"}]}
+
+        mock_adapter = MagicMock()
+        mock_adapter.get_remote_models = AsyncMock(side_effect=slow_remote)
+        mock_request.app.state.rest_adapter = mock_adapter
+
+        pending = [asyncio.ensure_future(_fetch_remote_models(mock_request)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending)
+        assert all(r == [{"name": "yolov8n"}] for r in results)
+        assert await _fetch_remote_models(mock_request) == [{"name": "yolov8n"}]
+        assert mock_adapter.get_remote_models.await_count == 1
+
+        app_state = mock_request.app.state
+        adapter, _, models = app_state.remote_models_cache
+        app_state.remote_models_cache = (adapter, 0.0, models)  # expire
+        await _fetch_remote_models(mock_request)
+        await _fetch_remote_models(mock_request)
+        assert mock_adapter.get_remote_models.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_inventory_cache_is_per_app(self, mock_request):
+        """Test that the cached inventory lives on app state, not in the module."""
+        mock_adapter = MagicMock()
+        mock_adapter.get_remote_models = AsyncMock(return_value={"models": [{"name": "yolov8n"}]})
+        mock_request.app.state.rest_adapter = mock_adapter
+        other_request = MagicMock()
+        other_request.app.state = State()
+        other_request.app.state.rest_adapter = mock_adapter
+
+        await _fetch_remote_models(mock_request)
+        await _fetch_remote_models(other_request)
+
+        assert mock_adapter.get_remote_models.await_count == 2
+        assert mock_request.app.state.remote_models_inflight is None
+
 
 class TestSwitchProviderMode:
     """Tests for _switch_provider_mode helper function."""
@@ -47,6 +47,11 @@ class TestSlugify:
         """Test underscores become hyphens."""
         assert slugify("hello_world_test") == "hello-world-test"
 
+    def test_mixed_separators_collapse(self):
+        """Test whitespace, underscores and hyphen runs collapse into single inner hyphens."""
+        assert slugify("  --Hello\t_\nWorld--  ") == "hello-world"
+        assert slugify("v2 -- Final_Fix!") == "v2-final-fix"
+
     def test_max_length(self):
         """Test max length truncation."""
         result = slugify("a" * 100, max_length=50)